@@ -0,0 +1,35 @@
+"""Общие данные тестов: гидроузел варианта 1 демонстрационного примера."""
+
+import pytest
+
+from wec import Geometry, HydrologicalSeries, StaticLevels
+
+MONTHS = list(range(1, 13))
+DOMESTIC = [540, 450, 740, 2850, 3500, 1100, 750, 630, 450, 465, 560, 410]
+GUARANTEED = [150, 130, 130, 200, 220, 160, 85, 100, 60, 130, 150, 140]
+# N_гар вариантов 2 и 3 (тот же гидроузел, что и в варианте 1)
+GUARANTEED_2 = [150, 115, 110, 200, 200, 150, 50, 70, 70, 120, 140, 140]
+GUARANTEED_3 = [120, 130, 135, 220, 190, 150, 85, 100, 70, 140, 150, 130]
+
+# Кривые гидроузла: V–Z (отметка ВБ, объём) и Q–Z (отметка НБ, расход)
+HW = [87, 89, 91, 93, 95, 97, 99, 101, 103]
+AV = [0.1, 0.4, 0.9, 2.3, 4.6, 8.8, 14.6, 21, 29.3]
+LWM = [81, 83, 85, 87, 89, 91]
+LWI = [100, 460, 1200, 2250, 3800, 5100]
+
+
+@pytest.fixture
+def geom():
+    return Geometry(
+        headwater_marks=HW, average_volumes=AV, lowwater_marks=LWM, lowwater_inflows=LWI
+    )
+
+
+@pytest.fixture
+def levels():
+    return StaticLevels(nrl=102, dead=97, installed_capacity=500)
+
+
+@pytest.fixture
+def series():
+    return HydrologicalSeries(MONTHS, DOMESTIC, GUARANTEED)
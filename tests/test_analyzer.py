@@ -0,0 +1,47 @@
+"""Тесты фасада :class:`~wec.facade.analyzer.WECAnalyzer`."""
+
+import pandas as pd
+
+from conftest import GUARANTEED_2
+from wec import HydrologicalSeries, WECAnalyzer
+
+
+def test_simulate_caches_the_selector(geom, levels, series):
+    wec = WECAnalyzer(geom, levels, series)
+    wec.simulate()
+    selector = wec._selector
+    assert selector is not None
+    wec.simulate("dynamic")
+    assert wec._selector is selector
+
+
+def test_reset_invalidates_selector_cache(geom, levels, series):
+    wec = WECAnalyzer(geom, levels, series)
+    wec.simulate()
+    other = HydrologicalSeries(series.months, series.domestic_inflows, GUARANTEED_2)
+
+    wec.reset(other)
+    assert wec.s is other
+    assert wec._selector is None
+
+    # результат после reset совпадает с новым анализатором на том же ряде
+    pd.testing.assert_frame_equal(
+        wec.simulate(), WECAnalyzer(geom, levels, other).simulate()
+    )
+    assert wec._selector is not None
+
+
+def test_assigning_inputs_invalidates_selector_cache(geom, levels, series):
+    other = HydrologicalSeries(series.months, series.domestic_inflows, GUARANTEED_2)
+    fresh = WECAnalyzer(geom, levels, other).simulate()
+
+    wec = WECAnalyzer(geom, levels, series)
+    wec.simulate()
+    wec.s = other
+    assert wec._selector is None
+    pd.testing.assert_frame_equal(wec.simulate(), fresh)
+
+    for name, value in (("g", geom), ("lvl", levels)):
+        wec.simulate()
+        setattr(wec, name, value)
+        assert wec._selector is None
@@ -0,0 +1,165 @@
+"""Тесты ДП‑оптимизатора :class:`~wec.optimizers.dynamic.DynamicOptimizer`."""
+
+import numpy as np
+import pytest
+
+import wec.optimizers.dynamic as dynamic
+from conftest import DOMESTIC, GUARANTEED, GUARANTEED_2, GUARANTEED_3, MONTHS
+from wec.constants import SECONDS_PER_MONTH
+from wec.core.formulas import compute_domestic_capacity
+from wec.core.month_selector import MonthSelector, OperationMode
+from wec.domain.hydrological_series import HydrologicalSeries
+from wec.optimizers.dynamic import DynamicOptimizer
+
+
+# Эталонные планы ΔV (км³, шаг сетки по умолчанию) для вариантов 1–3
+# демонстрационного примера; год повёрнут и начинается с октября.
+# Совпадают по (D, E) с эталонным ДП :func:`reference_dp` на той же сетке;
+# на грубых сетках это проверяет test_plan_is_optimal
+GOLDEN = {
+    1: [-1.103374233, -1.30398773, -1.504601227, -1.504601227, -1.404294479,
+        -0.702147239, 3.209815951, 4.313190184, 0.0, 0.0, 0.0, 0.0],
+    2: [-0.902760736, -1.103374233, -1.504601227, -1.504601227, -1.003067485,
+        0.0, 3.410429448, 2.60797546, 0.0, 0.0, 0.0, 0.0],
+    3: [-1.30398773, -1.30398773, -1.30398773, -0.802453988, -1.30398773,
+        -0.702147239, 2.808588957, 3.91196319, 0.0, 0.0, 0.0, 0.0],
+}
+GUARANTEED_BY_VARIANT = {1: GUARANTEED, 2: GUARANTEED_2, 3: GUARANTEED_3}
+
+
+@pytest.fixture
+def rotated(series, geom, levels):
+    return MonthSelector(series, geom, levels).rotated()
+
+
+def rotate_variant(variant, geom, levels):
+    series = HydrologicalSeries(MONTHS, DOMESTIC, GUARANTEED_BY_VARIANT[variant])
+    return MonthSelector(series, geom, levels).rotated()
+
+
+def reference_dp(geom, levels, series, modes, grid):
+    """Лучшие (дефицит D, выработка E) за год по сетке *grid* — прямой
+    перебор переходов с лексикографическим сравнением, без векторизации
+    и скалярной свёртки ``D·BIG − E``.  Год начинается и заканчивается
+    в НПУ (последний узел сетки)."""
+    z = [float(np.interp(v, geom.average_volumes, geom.headwater_marks)) for v in grid]
+    n = len(grid)
+    best = {n - 1: (0.0, 0.0)}  # узел → (D, −E)
+    for t, mode in enumerate(modes):
+        nxt = {}
+        for i, (d0, e0) in best.items():
+            for j in range(n):
+                if (mode is OperationMode.DISCHARGE) != (j <= i) and i != j:
+                    continue
+                d, e = transition(geom, levels, series, t, grid[i], grid[j], z[i], z[j])
+                cand = (d0 + d, e0 - e)
+                if j not in nxt or cand < nxt[j]:
+                    nxt[j] = cand
+        best = nxt
+    d, neg_e = best[n - 1]
+    return d, -neg_e
+
+
+def transition(geom, levels, series, t, v0, v1, z0, z1):
+    """Дефицит (МВт) и выработка (МВт·ч) месяца *t* при переходе V0 → V1."""
+    q = series.domestic_inflows[t] - (v1 - v0) * 1e9 / SECONDS_PER_MONTH
+    z_low = float(np.interp(q, geom.lowwater_inflows, geom.lowwater_marks))
+    n_ges = min(compute_domestic_capacity(q, 0.5 * (z0 + z1) - z_low),
+                levels.installed_capacity)
+    return max(0.0, series.guaranteed_capacity[t] - n_ges), n_ges * SECONDS_PER_MONTH / 3600.0
+
+
+def plan_objective(geom, levels, series, plan):
+    """(D, E) плана ΔV, посчитанные той же функцией перехода."""
+    volumes = geom.volume_at(levels.nrl) + np.concatenate([[0.0], np.cumsum(plan)])
+    z = np.interp(volumes, geom.average_volumes, geom.headwater_marks)
+    d = e = 0.0
+    for t in range(len(plan)):
+        dt, et = transition(geom, levels, series, t, volumes[t], volumes[t + 1], z[t], z[t + 1])
+        d, e = d + dt, e + et
+    return d, e
+
+
+@pytest.mark.parametrize("variant", sorted(GOLDEN))
+@pytest.mark.parametrize("numpy_path", [False, True])
+def test_golden_plan(monkeypatch, geom, levels, variant, numpy_path):
+    if numpy_path:
+        monkeypatch.setattr(dynamic, "HAS_NUMBA", False)
+    rot_s, modes = rotate_variant(variant, geom, levels)
+    plan = DynamicOptimizer().compute_dV(geom, levels, rot_s, modes)
+    assert plan == pytest.approx(GOLDEN[variant], abs=1e-9)
+
+
+@pytest.mark.parametrize("variant", sorted(GOLDEN))
+@pytest.mark.parametrize("step", [1.0, 0.5])
+def test_plan_is_optimal(geom, levels, variant, step):
+    rot_s, modes = rotate_variant(variant, geom, levels)
+    opt = DynamicOptimizer(step=step)
+    plan = opt.compute_dV(geom, levels, rot_s, modes)
+
+    v_dead, v_nrl = geom.volume_at(levels.dead), geom.volume_at(levels.nrl)
+    grid = np.linspace(v_dead, v_nrl, int(round((v_nrl - v_dead) / step)) + 1)
+    d_ref, e_ref = reference_dp(geom, levels, rot_s, modes, grid)
+    d, e = plan_objective(geom, levels, rot_s, plan)
+    assert d == pytest.approx(d_ref, abs=1e-6)
+    assert e == pytest.approx(e_ref, rel=1e-9)
+
+
+def test_plan_closes_the_year(geom, levels, rotated):
+    rot_s, modes = rotated
+    plan = DynamicOptimizer().compute_dV(geom, levels, rot_s, modes)
+    assert len(plan) == len(modes)
+    assert abs(sum(plan)) < 1e-9
+
+
+def test_numpy_path_block_size_does_not_change_plan(monkeypatch, geom, levels, rotated):
+    rot_s, modes = rotated
+    monkeypatch.setattr(dynamic, "HAS_NUMBA", False)
+    reference = DynamicOptimizer().compute_dV(geom, levels, rot_s, modes)
+    # крошечные блоки: много частичных прямоугольников переходов
+    monkeypatch.setattr(dynamic, "_DP_BLOCK", 7)
+    assert DynamicOptimizer().compute_dV(geom, levels, rot_s, modes) == reference
+
+
+# Порядок с повтором: результаты должны идти строго по сценариям
+BATCH_VARIANTS = [2, 1, 3, 2]
+
+
+@pytest.fixture
+def batch(geom, levels):
+    """Ансамбль из разных рядов N_гар (варианты 1–3)."""
+    pairs = [rotate_variant(v, geom, levels) for v in BATCH_VARIANTS]
+    return [s for s, _ in pairs], [m for _, m in pairs]
+
+
+def test_batch_matches_golden_plans(geom, levels, batch):
+    series_batch, modes_batch = batch
+    plans = DynamicOptimizer().compute_dV_batch(geom, levels, series_batch, modes_batch)
+    assert len(plans) == len(BATCH_VARIANTS)
+    for variant, plan in zip(BATCH_VARIANTS, plans):
+        assert plan == pytest.approx(GOLDEN[variant], abs=1e-9)
+
+
+def test_batch_length_mismatch(geom, levels, batch):
+    series_batch, modes_batch = batch
+    with pytest.raises(ValueError, match="must match"):
+        DynamicOptimizer().compute_dV_batch(geom, levels, series_batch, modes_batch[:-1])
+
+
+def test_batch_threads_match_golden_plans(monkeypatch, geom, levels, batch):
+    series_batch, modes_batch = batch
+    monkeypatch.setattr(dynamic, "HAS_NUMBA", False)  # потоки — только путь NumPy
+    opt = DynamicOptimizer()
+    threaded = opt.compute_dV_batch(geom, levels, series_batch, modes_batch, max_workers=4)
+    for variant, plan in zip(BATCH_VARIANTS, threaded):
+        assert plan == pytest.approx(GOLDEN[variant], abs=1e-9)
+    assert threaded == opt.compute_dV_batch(geom, levels, series_batch, modes_batch)
+
+
+def test_numba_and_numpy_paths_agree(monkeypatch, geom, levels, batch):
+    pytest.importorskip("numba")
+    series_batch, modes_batch = batch
+    opt = DynamicOptimizer()
+    jit = [opt.compute_dV(geom, levels, s, m) for s, m in zip(series_batch, modes_batch)]
+    monkeypatch.setattr(dynamic, "HAS_NUMBA", False)
+    assert [opt.compute_dV(geom, levels, s, m) for s, m in zip(series_batch, modes_batch)] == jit
@@ -0,0 +1,74 @@
+"""Тесты геометрии гидроузла :class:`~wec.domain.geometry.Geometry`."""
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+from conftest import AV, HW, LWI, LWM
+from wec import Geometry
+
+
+def make(hw=HW, av=AV, lwm=LWM, lwi=LWI):
+    return Geometry(
+        headwater_marks=hw, average_volumes=av, lowwater_marks=lwm, lowwater_inflows=lwi
+    )
+
+
+def with_point(curve, i, value):
+    """Копия кривой *curve* с заменённым узлом *i*."""
+    return [*curve[:i], value, *curve[i + 1:]]
+
+
+def test_valid_curves_are_accepted(geom):
+    assert geom.headwater_marks == tuple(float(z) for z in HW)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        # объёмы V–Z не возрастают строго
+        {"av": with_point(AV, 2, AV[1])},
+        {"av": with_point(AV, 2, AV[1] - 0.1)},
+        # отметка ВБ убывает с ростом объёма
+        {"hw": with_point(HW, 3, HW[2] - 1)},
+        # расходы Q–Z не возрастают строго
+        {"lwi": with_point(LWI, 2, LWI[1])},
+        # отметка НБ убывает с ростом расхода
+        {"lwm": with_point(LWM, 2, LWM[1] - 1)},
+        # разная длина узлов и значений
+        {"lwm": LWM[:-1]},
+        # меньше двух точек
+        {"hw": HW[:1], "av": AV[:1]},
+    ],
+)
+def test_invalid_curves_raise(kwargs):
+    with pytest.raises(ValueError):
+        make(**kwargs)
+
+
+@pytest.mark.parametrize("mark", [80.0, 87.0, 92.5, 100.0, 102.0, 103.0, 110.0])
+def test_volume_at_matches_numpy_interp(geom, mark):
+    assert geom.volume_at(mark) == float(np.interp(mark, HW, AV))
+
+
+@pytest.mark.parametrize(
+    "name", ["headwater_marks", "average_volumes", "lowwater_marks", "lowwater_inflows"]
+)
+def test_curves_cannot_be_reassigned(geom, name):
+    # кривая и её производные (наклоны, массивы, кэш Z → V) не расходятся
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        setattr(geom, name, [0.0, 1.0])
+
+
+def test_volume_at_is_cached(geom):
+    first = geom.volume_at(102.0)
+    assert geom._volume_cache == {102.0: first}
+    assert geom.volume_at(102.0) == first
+
+
+def test_volume_at_with_repeated_marks():
+    # повторяющаяся отметка (участок нулевой длины) не даёт деления на ноль
+    g = make(hw=with_point(HW, 2, HW[1]))
+    assert g.volume_at(HW[1]) == AV[2]
+    assert g.volume_at(91.0) == pytest.approx(AV[2] + (AV[3] - AV[2]) * 0.5)
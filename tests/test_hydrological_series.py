@@ -0,0 +1,33 @@
+"""Тесты контейнера :class:`~wec.domain.hydrological_series.HydrologicalSeries`."""
+
+import numpy as np
+import pytest
+
+from conftest import DOMESTIC, GUARANTEED, MONTHS
+from wec import HydrologicalSeries
+
+
+def test_series_are_contiguous_float64_arrays(series):
+    assert series.months.dtype == np.int64
+    assert series.domestic_inflows.dtype == np.float64
+    assert series.guaranteed_capacity.dtype == np.float64
+    assert series.domestic_inflows.flags.c_contiguous
+
+
+def test_equal_series_compare_equal(series):
+    other = HydrologicalSeries(list(MONTHS), list(DOMESTIC), list(GUARANTEED))
+    assert series == other
+    assert not (series != other)
+
+
+def test_different_series_compare_unequal(series):
+    other = list(GUARANTEED)
+    other[0] += 1
+    assert series != HydrologicalSeries(MONTHS, DOMESTIC, other)
+    assert series != HydrologicalSeries(MONTHS[:1], DOMESTIC[:1], GUARANTEED[:1])
+    assert series != "not a series"
+
+
+def test_length_mismatch_raises():
+    with pytest.raises(ValueError):
+        HydrologicalSeries(MONTHS, DOMESTIC[:-1], GUARANTEED)
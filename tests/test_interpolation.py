@@ -0,0 +1,19 @@
+"""Тесты интерполяции по умолчанию (:func:`~wec.core.interpolation.default_interp`)."""
+
+import numpy as np
+import pytest
+
+from conftest import LWI as XP, LWM as FP
+from wec.core.interpolation import default_interp
+
+
+@pytest.mark.parametrize("x", [0, 100, 333.3, 1200, np.float32(2999.5), 5100, 9000])
+def test_scalar_matches_numpy_interp(x):
+    result = default_interp(x, XP, FP)
+    assert isinstance(result, float)
+    assert result == float(np.interp(x, XP, FP))
+
+
+def test_array_matches_numpy_interp():
+    x = np.linspace(0.0, 6000.0, 101)
+    np.testing.assert_array_equal(default_interp(x, XP, FP), np.interp(x, XP, FP))
@@ -0,0 +1,27 @@
+"""Пользовательский интерполятор получает только скаляры (протокол ``-> float``)."""
+
+import numpy as np
+import pandas as pd
+
+from wec.core.month_selector import MonthSelector
+from wec.core.reservoir_simulator import ReservoirSimulator
+
+
+def scalar_only_interp(x, xp, fp):
+    # float() на массиве длины > 1 падает с TypeError
+    return float(np.interp(x, xp, fp))
+
+
+def test_month_selector_accepts_scalar_only_interp(series, geom, levels):
+    custom = MonthSelector(series, geom, levels, scalar_only_interp).calc_modes()
+    default = MonthSelector(series, geom, levels).calc_modes()
+    assert custom == default
+
+
+def test_simulator_accepts_scalar_only_interp(series, geom, levels):
+    rot_s, modes = MonthSelector(series, geom, levels).rotated()
+    custom = ReservoirSimulator(
+        geom, levels, rot_s, modes, "greedy", scalar_only_interp
+    ).run()
+    default = ReservoirSimulator(geom, levels, rot_s, modes, "greedy").run()
+    pd.testing.assert_frame_equal(custom, default)
@@ -0,0 +1,28 @@
+"""Тесты классификации месяцев :class:`~wec.core.month_selector.MonthSelector`."""
+
+import pytest
+
+from wec import HydrologicalSeries
+import wec.core.month_selector as month_selector
+from wec.core.month_selector import MonthSelector
+
+
+@pytest.mark.parametrize("n_months", [0, 1])
+def test_too_short_series_raises(geom, levels, n_months):
+    short = HydrologicalSeries(
+        list(range(1, n_months + 1)), [540.0] * n_months, [150.0] * n_months
+    )
+    with pytest.raises(ValueError):
+        MonthSelector(short, geom, levels).calc_modes()
+
+
+def test_two_month_series_is_classified(geom, levels):
+    two = HydrologicalSeries([1, 2], [540.0, 3500.0], [150.0, 220.0])
+    assert len(MonthSelector(two, geom, levels).calc_modes()) == 2
+
+
+def test_numba_and_numpy_paths_agree(monkeypatch, geom, levels, series):
+    pytest.importorskip("numba")
+    jit = MonthSelector(series, geom, levels).calc_modes()
+    monkeypatch.setattr(month_selector, "HAS_NUMBA", False)
+    assert MonthSelector(series, geom, levels).calc_modes() == jit
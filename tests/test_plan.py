@@ -0,0 +1,57 @@
+"""Тесты плана ΔV (:class:`~wec.optimizers.plan.Plan`) и ``compute_plan``."""
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+import wec.optimizers.plan as plan_module
+
+from wec.core.month_selector import MonthSelector
+from wec.core.reservoir_simulator import ReservoirSimulator
+from wec.optimizers import AbstractOptimizer, Plan, evaluate_plan
+
+
+class FixedOptimizer(AbstractOptimizer):
+    """Оптимизатор только с ``compute_dV``: −1 км³ в первые полгода, +1 — во вторые."""
+
+    def compute_dV(self, geom, levels, series, modes):
+        half = len(modes) // 2
+        return [-1.0] * half + [1.0] * (len(modes) - half)
+
+
+def test_default_compute_plan_evaluates_compute_dV(geom, levels, series):
+    rot_s, modes = MonthSelector(series, geom, levels).rotated()
+    plan = FixedOptimizer().compute_plan(geom, levels, rot_s, modes)
+
+    assert isinstance(plan, Plan)
+    np.testing.assert_array_equal(plan.dV, [-1.0] * 6 + [1.0] * 6)
+    # год начинается в НПУ, объёмы стыкуются по границам месяцев
+    assert plan.start_vol[0] == geom.volume_at(levels.nrl)
+    np.testing.assert_array_equal(plan.start_vol[1:], plan.end_vol[:-1])
+    np.testing.assert_allclose(plan.end_vol, plan.start_vol + plan.dV)
+    np.testing.assert_array_equal(plan.start_head[1:], plan.end_head[:-1])
+    # мощность ГЭС не превышает установленную
+    assert (plan.n_ges <= levels.installed_capacity).all()
+
+
+def test_simulator_reports_the_plan(geom, levels, series):
+    rot_s, modes = MonthSelector(series, geom, levels).rotated()
+    df = ReservoirSimulator(geom, levels, rot_s, modes, FixedOptimizer()).run()
+    plan = evaluate_plan(FixedOptimizer().compute_dV(geom, levels, rot_s, modes), geom, levels, rot_s)
+
+    np.testing.assert_array_equal(df["dV, км³"], plan.dV)
+    np.testing.assert_array_equal(df["V_вдх_кон, км³"], plan.end_vol)
+    np.testing.assert_array_equal(df["H, м"], plan.pressure)
+    np.testing.assert_array_equal(df["N_ГЭС, МВт"], plan.n_ges)
+
+
+def test_numba_and_numpy_paths_agree(monkeypatch, geom, levels, series):
+    pytest.importorskip("numba")
+    rot_s, modes = MonthSelector(series, geom, levels).rotated()
+    dv = FixedOptimizer().compute_dV(geom, levels, rot_s, modes)
+    jit = evaluate_plan(dv, geom, levels, rot_s)
+    monkeypatch.setattr(plan_module, "HAS_NUMBA", False)
+    ref = evaluate_plan(dv, geom, levels, rot_s)
+    for field in dataclasses.fields(Plan):
+        np.testing.assert_array_equal(getattr(jit, field.name), getattr(ref, field.name), field.name)
@@ -0,0 +1,54 @@
+"""Тесты графиков :mod:`wec.visualization.plots` (без показа, backend Agg)."""
+
+import pytest
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+from wec.facade.analyzer import WECAnalyzer  # noqa: E402
+from wec.visualization.plots import (  # noqa: E402
+    plot_all,
+    plot_domestic_inflow,
+    plot_guaranteed_capacity,
+    plot_reservoir_levels,
+)
+
+
+@pytest.fixture
+def df(geom, levels, series):
+    return WECAnalyzer(geom, levels, series).simulate()
+
+
+def test_helpers_draw_into_given_axes(levels, series, df):
+    fig, ax = plt.subplots()
+    try:
+        assert plot_domestic_inflow(series, ax) is ax
+        assert plot_guaranteed_capacity(series, ax) is ax
+        assert plot_reservoir_levels(df, levels, ax) is ax
+    finally:
+        plt.close(fig)
+
+
+def test_plot_all_returns_three_panel_figure(levels, series, df):
+    fig = plot_all(series, df, levels)
+    try:
+        assert len(fig.axes) == 3
+        assert [ax.get_title() for ax in fig.axes][:2] == [
+            "Бытовая приточность по месяцам",
+            "Гарантированная мощность по месяцам",
+        ]
+        # линия уровней: 12 месяцев + замыкающая точка
+        assert len(fig.axes[2].lines[0].get_xdata()) == len(df) + 1
+    finally:
+        plt.close(fig)
+
+
+def test_analyzer_plot_all(geom, levels, series):
+    analyzer = WECAnalyzer(geom, levels, series)
+    fig = analyzer.plot_all(analyzer.simulate())
+    try:
+        assert len(fig.axes) == 3
+    finally:
+        plt.close(fig)
@@ -0,0 +1,45 @@
+"""Тесты реестра оптимизаторов (``register`` / ``get``)."""
+
+import pytest
+
+import wec.optimizers as optimizers
+from wec.optimizers import AbstractOptimizer, get, register
+from wec.optimizers.dynamic import DynamicOptimizer
+from wec.optimizers.greedy import GreedyOptimizer
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Копия реестра: регистрации внутри теста не переживают его."""
+    monkeypatch.setattr(optimizers, "_REGISTRY", dict(optimizers._REGISTRY))
+    return optimizers._REGISTRY
+
+
+class ZeroOptimizer(AbstractOptimizer):
+    def compute_dV(self, geom, levels, series, modes):
+        return [0.0] * len(modes)
+
+
+def test_builtin_aliases():
+    assert type(get("greedy")) is GreedyOptimizer
+    assert type(get("dynamic")) is DynamicOptimizer
+    assert type(get()) is GreedyOptimizer
+
+
+def test_unknown_alias():
+    with pytest.raises(ValueError, match="Unknown optimizer 'nope'"):
+        get("nope")
+
+
+def test_register_custom(registry):
+    assert register("zero")(ZeroOptimizer) is ZeroOptimizer
+    assert type(get("zero")) is ZeroOptimizer
+    # тот же класс повторно — не ошибка
+    register("zero")(ZeroOptimizer)
+
+
+def test_register_duplicate_alias(registry):
+    get("greedy")  # встроенный алиас уже в реестре
+    with pytest.raises(ValueError, match="already registered"):
+        register("greedy")(ZeroOptimizer)
+    assert type(get("greedy")) is GreedyOptimizer
@@ -0,0 +1,163 @@
+# wec/core/_kernels.py
+"""Численные «ядра» горячих циклов, компилируемые Numba (если установлена).
+
+Numba — *необязательная* зависимость (``pip install wec[jit]``).  Если
+пакет недоступен, флаг ``HAS_NUMBA`` (определён в :mod:`.interpolation`)
+равен ``False``, а вызывающий код остаётся на обычной реализации
+NumPy/Python.  Функции модуля работают
+только с ``ndarray`` и скалярами, без объектов предметной области, —
+это требование nopython‑режима Numba.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .formulas import _POWER_COEF
+from .interpolation import HAS_NUMBA, fast_lerp, njit
+
+if HAS_NUMBA:
+    from numba import prange
+else:  # pragma: no cover - зависит от окружения
+    prange = range
+
+__all__ = ["HAS_NUMBA", "classify_modes", "simulate_year", "dp_tables"]
+
+
+@njit(cache=True)
+def classify_modes(q_byt, n_gar, lw_inflows, lw_marks, nrl):
+    """Режимы месяцев: 1 — сработка, 0 — наполнение.
+
+    Повторяет :meth:`MonthSelector.calc_modes`: сравнение N_быт при НПУ
+    с N_гар и последующее сглаживание одиночных «ложных» наполнений
+    (включая переход через границу года).
+    """
+    n = q_byt.shape[0]
+    out = np.empty(n, dtype=np.int8)
+    for i in range(n):
+        z_low = fast_lerp(q_byt[i], lw_inflows, lw_marks)
+        n_byt = _POWER_COEF * q_byt[i] * (nrl - z_low)
+        out[i] = 1 if n_byt < n_gar[i] else 0
+
+    # --- фильтрация одиночных «ложных» наполнений ---
+    for i in range(1, n - 1):
+        if out[i - 1] == 1 and out[i] == 0 and out[i + 1] == 1:
+            out[i] = 1
+
+    # --- циклический край года ---
+    if out[n - 1] == 1 and out[0] == 0 and out[1] == 1:
+        out[0] = 1
+    if out[n - 2] == 1 and out[n - 1] == 0 and out[0] == 1:
+        out[n - 1] = 1
+    return out
+
+
+@njit(cache=True)
+def simulate_year(dV, q_byt, hw, av, lwm, lwi, nrl_volume, installed_capacity, seconds_per_month):
+    """Помесячный расчёт года по готовому плану ΔV.
+
+    Повторяет векторный путь :meth:`ReservoirSimulator.run` с тем же
+    порядком операций (результаты совпадают бит‑в‑бит).  Возвращает
+    кортеж массивов ``(V_нач, V_кон, Z_вб_нач, Z_вб_кон, Q_вдх, Q_ГЭС,
+    Z_нб, H, N_быт, N_ГЭС)``.
+    """
+    n = dV.shape[0]
+    start_vol = np.empty(n)
+    end_vol = np.empty(n)
+    start_head = np.empty(n)
+    end_head = np.empty(n)
+    res_delta_q = np.empty(n)
+    plant_q = np.empty(n)
+    z_low = np.empty(n)
+    pressure = np.empty(n)
+    n_byt = np.empty(n)
+    n_ges = np.empty(n)
+
+    vol = nrl_volume
+    z_start = fast_lerp(vol, av, hw)
+    for i in range(n):
+        vol_end = vol + dV[i]
+        z_end = fast_lerp(vol_end, av, hw)
+
+        dq = (-dV[i] * 1e9) / seconds_per_month
+        q = q_byt[i] + dq
+        zl = fast_lerp(q, lwi, lwm)
+        h = 0.5 * (z_start + z_end) - zl
+
+        start_vol[i] = vol
+        end_vol[i] = vol_end
+        start_head[i] = z_start
+        end_head[i] = z_end
+        res_delta_q[i] = dq
+        plant_q[i] = q
+        z_low[i] = zl
+        pressure[i] = h
+        n_byt[i] = _POWER_COEF * q_byt[i] * h
+        n_ges[i] = min(_POWER_COEF * q * h, installed_capacity)
+
+        vol = vol_end
+        z_start = z_end
+    return (
+        start_vol, end_vol, start_head, end_head, res_delta_q,
+        plant_q, z_low, pressure, n_byt, n_ges,
+    )
+
+
+@njit(cache=True, parallel=True)
+def dp_tables(
+    grid, z_grid, q_byt, n_gar, discharge, lw_inflows, lw_marks,
+    installed_capacity, dead_level, seconds_per_month, deficit_weight,
+    start_idx,
+):
+    """Таблицы прямого хода ДП :class:`~wec.optimizers.dynamic.DynamicOptimizer`.
+
+    Повторяет векторный путь оптимизатора (тот же порядок операций и та же
+    скалярная стоимость ``D·deficit_weight − E``; при равенстве — меньший *i*).
+    Сетка ``grid`` должна строго возрастать: знак ΔV определяется
+    порядком индексов, и перебираются только допустимые *i*.
+    Столбцы *j* (конечные состояния месяца) независимы, поэтому цикл по
+    ним распараллелен ``prange``.  ``discharge[t]`` — 1 для сработки,
+    0 для наполнения.  Стоимости хранятся двумя строками (текущий и
+    следующий месяц).  Возвращает ``(стоимости в конце года, prev)``.
+    """
+    n_months = q_byt.shape[0]
+    n = grid.shape[0]
+    inf = np.inf
+    cost = np.full(n, inf)
+    next_cost = np.empty(n)
+    prev = np.full((n_months, n), -1, dtype=np.int32)
+    cost[start_idx] = 0.0
+
+    for t in range(n_months):
+        next_cost[:] = inf
+        for j in prange(n):
+            if z_grid[j] < dead_level - 1e-9:
+                continue
+            best = inf
+            best_i = -1
+            # сетка возрастает: сработка (ΔV ≤ 0) — только i ≥ j,
+            # наполнение (ΔV ≥ 0) — только i ≤ j
+            if discharge[t] == 1:
+                i_lo, i_hi = j, n
+            else:
+                i_lo, i_hi = 0, j + 1
+            for i in range(i_lo, i_hi):
+                if z_grid[i] < dead_level - 1e-9 or cost[i] == inf:
+                    continue
+                dV = grid[j] - grid[i]
+                q = q_byt[t] - dV * 1e9 / seconds_per_month
+                z_low = fast_lerp(q, lw_inflows, lw_marks)
+                head = 0.5 * (z_grid[i] + z_grid[j]) - z_low
+                n_ges = min(_POWER_COEF * q * head, installed_capacity)
+                deficit = max(0.0, n_gar[t] - n_ges)
+                energy = n_ges * seconds_per_month / 3600.0
+                c = cost[i] + (deficit * deficit_weight - energy)
+                if c < best:  # строгое «<»: при равенстве остаётся меньший i
+                    best = c
+                    best_i = i
+            if best_i >= 0:  # иначе состояние j в конце месяца недостижимо
+                next_cost[j] = best
+                prev[t, j] = best_i
+        # следующий месяц становится текущим (строки меняются местами)
+        cost, next_cost = next_cost, cost
+    return cost, prev
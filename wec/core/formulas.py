@@ -12,23 +12,62 @@
 
 from __future__ import annotations
 
-from .interpolation import Interpolator, default_interp
+import numpy as np
+
+from .interpolation import (
+    HAS_NUMBA,
+    Interpolator,
+    default_interp,
+    fast_lerp_many,
+)
 from ..domain.geometry import Geometry
 
+# Коэффициент формулы мощности 8.5 / 1000 (кВт → МВт), свёрнутый заранее:
+# одно умножение вместо умножения и деления при каждом вызове
+_POWER_COEF: float = 8.5 / 1000.0
+
+
+def _is_vector(x) -> bool:
+    """Одномерный ``ndarray`` — вход для :func:`fast_lerp_many`."""
+    return isinstance(x, np.ndarray) and x.ndim == 1
+
+
+def _interp_points(interp: Interpolator, x, xp, fp):
+    """Вызвать пользовательский интерполятор для скаляра или массива *x*.
+
+    По протоколу :class:`Interpolator` интерполятор считает **одну** точку
+    (``-> float``), поэтому массив передаётся ему поэлементно; векторный
+    вызов допустим только для ``default_interp``.
+    """
+    if isinstance(x, np.ndarray):
+        return np.array(
+            [interp(float(v), xp, fp) for v in x.ravel()], dtype=np.float64
+        ).reshape(x.shape)
+    return interp(x, xp, fp)
+
+
 # ---------------------------------------------------------------------------
 # Базовые функции‑помощники
 # ---------------------------------------------------------------------------
 
 
-def compute_lowwater_mark(q: float, geom: Geometry, interp: Interpolator = default_interp) -> float:
+def compute_lowwater_mark(
+    q: float | np.ndarray, geom: Geometry, interp: Interpolator = default_interp
+) -> float | np.ndarray:
     """Вычислить *уровень нижнего бьефа* **Zₙб** (м).
 
     Значение получается линейной или сплайн‑интерполяцией по расходной
     Q–Z кривой, хранящейся в объекте :class:`Geometry`.
 
+    Принимает скаляр или ``ndarray`` любой формы (все месяцы или все
+    переходы ДП одним вызовом).  С ``default_interp`` массив считается
+    векторно (одномерный массив — ядром Numba, если она установлена,
+    иначе ``numpy.interp``); пользовательский интерполятор получает точки
+    массива по одной (см. :class:`Interpolator`).
+
     Параметры
     ----------
-    q : float
+    q : float | ndarray
         Сброс через турбину или общий расход в нижний бьеф (м³/с).
     geom : Geometry
         Геометрия гидроузла с набором кривых.
@@ -38,20 +77,46 @@ def compute_lowwater_mark(q: float, geom: Geometry, interp: Interpolator = defau
 
     Возвращает
     ----------
-    float
-        Отметка нижнего бьефа Zₙб, м БС.
+    float | ndarray
+        Отметка нижнего бьефа Zₙб, м БС; для массива — массив той же
+        формы.
     """
-    # Интерполируем точку расходной кривой (Q → Zₙб)
-    return interp(q, geom.lowwater_inflows, geom.lowwater_marks)
-
-
-def compute_headwater_mark(volume: float, geom: Geometry, interp: Interpolator = default_interp) -> float:
+    # Интерполируем точку расходной кривой (Q → Zₙб); для скаляра и
+    # интерполятора по умолчанию — по предрассчитанным наклонам кривой
+    if interp is default_interp and isinstance(q, (int, float)):
+        return geom.interp_lowwater(q)
+    if HAS_NUMBA and interp is default_interp and _is_vector(q):
+        # ряд точек — скомпилированный поиск+lerp по кривой‑таблице
+        return fast_lerp_many(
+            np.ascontiguousarray(q, dtype=np.float64), geom._lwi, geom._lwm
+        )
+    if interp is default_interp:
+        # массивы кривых уже подготовлены геометрией (float64, без копий)
+        return interp(q, geom._lwi, geom._lwm)
+    return _interp_points(interp, q, geom.lowwater_inflows, geom.lowwater_marks)
+
+
+def compute_headwater_mark(
+    volume: float | np.ndarray, geom: Geometry, interp: Interpolator = default_interp
+) -> float | np.ndarray:
     """Вычислить *уровень верхнего бьефа* **Zᵥб** (м) для заданного объёма.
 
     Используется кривая наполнение‑отметка (V–Z) из :class:`Geometry`.
+    Как и :func:`compute_lowwater_mark`, принимает скаляр или ``ndarray``
+    (объём в км³) и возвращает отметку той же формы; массив считается
+    векторно только с ``default_interp``, пользовательскому
+    интерполятору точки передаются по одной.
     """
     # Интерполируем точку кривой наполнение‑отметка (V → Zᵥб)
-    return interp(volume, geom.average_volumes, geom.headwater_marks)
+    if interp is default_interp and isinstance(volume, (int, float)):
+        return geom.interp_headwater(volume)
+    if HAS_NUMBA and interp is default_interp and _is_vector(volume):
+        return fast_lerp_many(
+            np.ascontiguousarray(volume, dtype=np.float64), geom._av, geom._hw
+        )
+    if interp is default_interp:
+        return interp(volume, geom._av, geom._hw)
+    return _interp_points(interp, volume, geom.average_volumes, geom.headwater_marks)
 
 
 def compute_domestic_capacity(q: float, h: float) -> float:
@@ -69,4 +134,4 @@ def compute_domestic_capacity(q: float, h: float) -> float:
           падения и усреднённый КПД агрегатов,
         * деление на 1000 переводит кВт в МВт.
     """
-    return 8.5 * q * h / 1000.0
\ No newline at end of file
+    return _POWER_COEF * q * h
\ No newline at end of file
@@ -7,14 +7,33 @@
 2. Избежать прямой зависимости бизнес‑логики от конкретного пакета
    SciPy/NumPy (в дальнейшем можно будет заменить реализацию,
    сохранив сигнатуру вызова).
+
+Здесь же живёт :func:`fast_lerp` — бинарный поиск + линейная
+интерполяция, компилируемые Numba (если она установлена; флаг
+``HAS_NUMBA``).  Это общий «кирпичик» для JIT‑ядер
+:mod:`wec.core._kernels` и векторного пути формул.
 """
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from typing import Protocol, Sequence
 
 import numpy as np
 
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - зависит от окружения
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Заглушка декоратора: без Numba функция остаётся Python‑кодом."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 
 class Interpolator(Protocol):
     """Простейший протокол для 1‑D интерполяции.
@@ -23,15 +42,19 @@ class Interpolator(Protocol):
     считается валидным интерполятором.  Благодаря этому можно легко
     внедрять *mocks* в юнит‑тестах и не зависеть напрямую от
     ``numpy.interp``.
+
+    Пользовательский интерполятор всегда получает **скаляр** ``x``:
+    векторные расчёты по месяцам вызывают его поэлементно.  Массивы
+    целиком передаются только в :func:`default_interp`.
     """
 
-    def __call__(self, x: float | np.ndarray, xp: Sequence[float], fp: Sequence[float]) -> float:  # noqa: E501
+    def __call__(self, x: float, xp: Sequence[float], fp: Sequence[float]) -> float:  # noqa: E501
         """Вычислить интерполированное значение.
 
         Параметры
         ----------
-        x : float | ndarray
-            Точка или массив точек, в которых нужно найти значение.
+        x : float
+            Точка, в которой нужно найти значение.
         xp : Sequence[float]
             Узлы интерполяции (монотонно возрастающие x‑координаты).
         fp : Sequence[float]
@@ -40,10 +63,79 @@ class Interpolator(Protocol):
         ...
 
 
-def default_interp(x: float | np.ndarray, xp: Sequence[float], fp: Sequence[float]) -> float:  # noqa: E501
+def scalar_interp(x: float, xp: Sequence[float], fp: Sequence[float]) -> float:
+    """Линейная интерполяция **одной** точки без обращения к ``numpy``.
+
+    Узел отрезка ищется бинарным поиском (:func:`bisect.bisect_right`),
+    поэтому стоимость вызова — O(log N) сравнений вместо создания
+    временных массивов внутри :func:`numpy.interp`.  Поведение на краях
+    совпадает с ``numpy.interp``: вне диапазона ``xp`` возвращается
+    крайнее значение ``fp``.
+
+    Требование: ``xp`` монотонно возрастает (так устроены кривые V–Z и
+    Q–Z в :class:`~wec.domain.geometry.Geometry`).
+    """
+    # Вне диапазона узлов — «полка», как у numpy.interp
+    if x <= xp[0]:
+        return float(fp[0])
+    if x >= xp[-1]:
+        return float(fp[-1])
+
+    # xp[i-1] <= x < xp[i]; границы lo/hi страхуют от выхода за массив
+    i = bisect_right(xp, x, 1, len(xp) - 1)
+    x0, y0 = xp[i - 1], fp[i - 1]
+    slope = (fp[i] - y0) / (xp[i] - x0)
+    return float(slope * (x - x0) + y0)
+
+
+@njit(cache=True)
+def fast_lerp(x, xs, ys):
+    """Линейная интерполяция скаляра по ``ndarray``‑кривой (JIT).
+
+    Тот же алгоритм, что и :func:`scalar_interp` (крайние «полки»,
+    бинарный поиск участка, ``slope * (x - x0) + y0``), поэтому результат
+    совпадает с ``numpy.interp`` бит‑в‑бит.  Предназначена для вызова из
+    других JIT‑функций, где она встраивается в нативный цикл.
+    """
+    n = xs.shape[0]
+    if x <= xs[0]:
+        return ys[0]
+    if x >= xs[n - 1]:
+        return ys[n - 1]
+    # бинарный поиск участка xs[lo] <= x < xs[lo + 1]
+    lo = 0
+    hi = n - 1
+    while hi - lo > 1:
+        mid = (lo + hi) >> 1
+        if xs[mid] <= x:
+            lo = mid
+        else:
+            hi = mid
+    slope = (ys[lo + 1] - ys[lo]) / (xs[lo + 1] - xs[lo])
+    return slope * (x - xs[lo]) + ys[lo]
+
+
+@njit(cache=True)
+def fast_lerp_many(x, xs, ys):
+    """:func:`fast_lerp` для массива точек ``x`` (одномерный ``float64``)."""
+    out = np.empty(x.shape[0])
+    for i in range(x.shape[0]):
+        out[i] = fast_lerp(x[i], xs, ys)
+    return out
+
+
+def default_interp(x: float | np.ndarray, xp: Sequence[float], fp: Sequence[float]) -> float | np.ndarray:  # noqa: E501
     """Обёртка над :func:`numpy.interp`, позволяющая легко подменять реализацию.
 
-    Возвращается **float**, даже если на вход подали ``ndarray``: это сделано
-    для упрощения дальнейших расчётов, где ожидается скаляр.
+    Для скаляра возвращается **float**, для ``ndarray`` — массив той же
+    формы: так помесячные расчёты можно выполнять одним векторным
+    вызовом вместо цикла по месяцам.
+
+    Скаляр считается :func:`scalar_interp` (бинарный поиск без создания
+    временных массивов NumPy); ``numpy.interp`` вызывается только для
+    массивов.
     """
-    return float(np.interp(x, xp, fp))
+    if isinstance(x, (int, float, np.number)):
+        # float(): скаляры NumPy (float32 и т.п.) считаем в float64, как numpy.interp
+        return scalar_interp(float(x), xp, fp)
+    return np.interp(x, xp, fp)
@@ -26,11 +26,14 @@ import logging
 from enum import Enum, auto
 from typing import List, Sequence, Tuple
 
+import numpy as np
+
 from ..domain.hydrological_series import HydrologicalSeries
 from ..domain.geometry import Geometry
 from ..domain.static_levels import StaticLevels
 from .interpolation import Interpolator, default_interp
 from .formulas import compute_lowwater_mark, compute_domestic_capacity
+from ._kernels import HAS_NUMBA, classify_modes
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +46,13 @@ class OperationMode(Enum):
 
     # Улучшенный вывод в лог/print
     def __str__(self) -> str:  # prettier string
-        return "наполнение" if self is OperationMode.FILL else "сработка"
+        return "наполнение" if self is _FILL else "сработка"
+
+
+# Члены перечисления, привязанные к именам модуля: в горячих циклах
+# это одно обращение к глобальному имени вместо двух (имя + атрибут)
+_FILL = OperationMode.FILL
+_DISCHARGE = OperationMode.DISCHARGE
 
 
 class MonthSelector:
@@ -69,6 +78,11 @@ class MonthSelector:
         self._levels = levels
         self._interp = interp
 
+        # Кэш результатов: входы селектора не меняются, поэтому режимы и
+        # повёрнутый ряд достаточно рассчитать один раз
+        self._modes: List[OperationMode] | None = None
+        self._rotated: Tuple[HydrologicalSeries, List[OperationMode]] | None = None
+
     # ------------------------------------------------------------------
     # Шаг 1: классификация месяцев без поворота
     # ------------------------------------------------------------------
@@ -80,45 +94,61 @@ class MonthSelector:
         (рассчитанная при уровне НПУ) меньше гарантированной **N_гар**.
         Независимо от того, насколько больше **N_гар**, запас ≥ 1 МВт
         считается достаточным.
+
+        Результат кэшируется; наружу отдаётся копия списка, чтобы
+        вызывающий код не мог испортить кэш.
         """
-        modes: List[OperationMode] = []
+        if self._modes is not None:
+            return list(self._modes)
+
         nrl_level = self._levels.nrl  # нормальный подпорный уровень
 
-        # --- первичная классификация ---
-        for q_byt, n_gar in zip(self._s.domestic_inflows, self._s.guaranteed_capacity):
-            # Отметка нижнего бьефа при бытовом расходе Q_быт
+        q_byt = np.asarray(self._s.domestic_inflows, dtype=np.float64)
+        n_gar = np.asarray(self._s.guaranteed_capacity, dtype=np.float64)
+
+        # Сглаживание на границе года смотрит на два соседних месяца;
+        # проверяем до выбора пути (ядро Numba не контролирует границы)
+        if len(q_byt) < 2:
+            raise ValueError(
+                "At least two months are required to classify operation modes."
+            )
+
+        # Режимы считаем в виде флагов: 1 — сработка, 0 — наполнение
+        if HAS_NUMBA and self._interp is default_interp:
+            # --- быстрый путь: весь расчёт в скомпилированном ядре Numba ---
+            flags = classify_modes(
+                q_byt,
+                n_gar,
+                self._geom._lwi,
+                self._geom._lwm,
+                float(nrl_level),
+            ).tolist()
+        else:
+            # --- первичная классификация (сразу для всех месяцев) ---
+            # Отметки нижнего бьефа при бытовых расходах Q_быт
             z_low = compute_lowwater_mark(q_byt, self._geom, self._interp)
             head = nrl_level - z_low  # предполагаем, что водоём полон (НПУ)
             n_byt = compute_domestic_capacity(q_byt, head)
-
-            mode = OperationMode.DISCHARGE if n_byt < n_gar else OperationMode.FILL
-            modes.append(mode)
-
-        # --- фильтрация одиночных «ложных» наполнений ---
-        for i in range(1, len(modes) - 1):
-            if (
-                modes[i - 1] is OperationMode.DISCHARGE
-                and modes[i]     is OperationMode.FILL
-                and modes[i + 1] is OperationMode.DISCHARGE
-            ):
-                # Считаем промежуточный месяц частью периода сработки
-                modes[i] = OperationMode.DISCHARGE
-          # --- обработка циклического края года (D‑F‑D через границу) ---
-
-        if (
-            modes[-1] is OperationMode.DISCHARGE
-            and modes[0] is OperationMode.FILL
-            and modes[1] is OperationMode.DISCHARGE
-        ):
-            modes[0] = OperationMode.DISCHARGE
-
-        if (
-            modes[-2] is OperationMode.DISCHARGE
-            and modes[-1] is OperationMode.FILL
-            and modes[0] is OperationMode.DISCHARGE
-        ):
-            modes[-1] = OperationMode.DISCHARGE
-        return modes
+            flags = (n_byt < n_gar).astype(np.int8).tolist()
+
+            # --- фильтрация одиночных «ложных» наполнений ---
+            for i in range(1, len(flags) - 1):
+                if flags[i - 1] == 1 and flags[i] == 0 and flags[i + 1] == 1:
+                    # Считаем промежуточный месяц частью периода сработки
+                    flags[i] = 1
+
+            # --- обработка циклического края года (D‑F‑D через границу) ---
+            if flags[-1] == 1 and flags[0] == 0 and flags[1] == 1:
+                flags[0] = 1
+            if flags[-2] == 1 and flags[-1] == 0 and flags[0] == 1:
+                flags[-1] = 1
+
+        modes: List[OperationMode] = [
+            _DISCHARGE if flag else _FILL
+            for flag in flags
+        ]
+        self._modes = modes
+        return list(modes)
 
     # ------------------------------------------------------------------
     # Шаг 2: поворот годовой последовательности месяцев
@@ -131,20 +161,34 @@ class MonthSelector:
         считаем его началом года.  Если такой месяц не найден, оставляем
         исходный порядок, но выводим предупреждение в лог.
         """
+        if self._rotated is not None:
+            cached_series, cached_modes = self._rotated
+            return cached_series, list(cached_modes)
+
         modes = self.calc_modes()
-        try:
-            # Первый DISCHARGE‑месяц после сентября (индекс > 8)
-            start_idx = next(
-                i for i, m in enumerate(modes) if m is OperationMode.DISCHARGE and i > 8
-            )
-        except StopIteration:
+
+        # Первый DISCHARGE‑месяц после сентября (индекс > 8)
+        start_idx = -1
+        for i in range(9, len(modes)):
+            if modes[i] is _DISCHARGE:
+                start_idx = i
+                break
+
+        if start_idx < 0:
             logger.warning(
                 "No discharge month found after September; keeping original order."
             )
-            return self._s, modes  # ничего не поворачиваем
-
-        # Локальная вспомогательная функция для поворота списка/кортежа
-        def _rot(lst: Sequence):
+            self._rotated = (self._s, modes)  # ничего не поворачиваем
+            return self._s, list(modes)
+
+        # Локальная вспомогательная функция для поворота ряда/списка
+        def _rot(lst: Sequence) -> Sequence:
+            if isinstance(lst, np.ndarray):
+                # «+» у массивов — поэлементное сложение, склеиваем явно
+                return np.concatenate((lst[start_idx:], lst[:start_idx]))
+            if isinstance(lst, list):
+                # срезы списка уже являются новыми списками
+                return lst[start_idx:] + lst[:start_idx]
             return list(lst[start_idx:]) + list(lst[:start_idx])
 
         # Собираем новый объект HydrologicalSeries с повернутыми массивами
@@ -154,4 +198,5 @@ class MonthSelector:
             guaranteed_capacity=_rot(self._s.guaranteed_capacity),
         )
         rotated_modes = _rot(modes)
-        return rotated_series, rotated_modes
+        self._rotated = (rotated_series, rotated_modes)
+        return rotated_series, list(rotated_modes)
@@ -20,37 +20,38 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
 from typing import List
 
 import numpy as np
 import pandas as pd
 
 from .month_selector import OperationMode
-from .formulas import (
-    compute_headwater_mark,
-    compute_lowwater_mark,
-    compute_domestic_capacity,
-)
 from .interpolation import Interpolator, default_interp
 from ..domain.geometry import Geometry
 from ..domain.static_levels import StaticLevels
 from ..domain.hydrological_series import HydrologicalSeries
-from ..constants import SECONDS_PER_MONTH
 from ..optimizers import AbstractOptimizer, get as get_optimizer
 
 logger = logging.getLogger(__name__)
 
-# ---------------------------------------------------------------------------
-# Состояние водохранилища на данный месяц
-# ---------------------------------------------------------------------------
-
-
-@dataclass
-class ReservoirState:
-    """Минимальный контейнер для хранения текущего объёма."""
-
-    volume: float  # км³ – объём воды в начале месяца
+# Колонки итоговой таблицы (в порядке вывода)
+_REPORT_COLUMNS = (
+    "Месяц",
+    "Режим",
+    "Q_быт, м³/с",
+    "Q_вдх, м³/с",
+    "Q_ГЭС, м³/с",
+    "dV, км³",
+    "V_вдх_нач, км³",
+    "V_вдх_кон, км³",
+    "Z_вб_нач, м",
+    "Z_вб_кон, м",
+    "Z_нб, м",
+    "H, м",
+    "N_быт, МВт",
+    "N_гар, МВт",
+    "N_ГЭС, МВт",
+)
 
 
 # ---------------------------------------------------------------------------
@@ -64,8 +65,9 @@ class ReservoirSimulator:
     Шаги работы:
     1. Оптимизатор выдаёт список ΔV (км³) длиной 12
        (отрицательные – сработка, положительные – наполнение).
-    2. Симулятор последовательно применяет эти ΔV, считая уровни,
-       напоры, расходы и мощности.
+    2. По этим ΔV рассчитываются уровни, напоры, расходы и мощности
+       (:meth:`AbstractOptimizer.compute_plan`, по умолчанию —
+       :func:`~wec.optimizers.plan.evaluate_plan`).
     3. Результаты аккумулируются в таблицу, пригодную для анализа
        (вывод в PDF/Excel, построение графиков, проверка KPI).
     """
@@ -99,14 +101,6 @@ class ReservoirSimulator:
         )
         self.interp = interp
 
-        # Предрассчитываем объёмы, соответствующие НПУ и УМО
-        self._nrl_volume = float(
-            np.interp(levels.nrl, geom.headwater_marks, geom.average_volumes)
-        )
-        self._dead_volume = float(
-            np.interp(levels.dead, geom.headwater_marks, geom.average_volumes)
-        )
-
     # ------------------------------------------------------------------
     # Главная точка входа симуляции
     # ------------------------------------------------------------------
@@ -114,82 +108,50 @@ class ReservoirSimulator:
     def run(self) -> pd.DataFrame:
         """Запустить годовую симуляцию и вернуть подробный DataFrame."""
         logger.info("Starting reservoir simulation …")
+        series, modes = self.series, self.modes  # локальные ссылки
 
-        # Начальное состояние – водоём заполнен до НПУ
-        state = ReservoirState(volume=self._nrl_volume)
-        records: list[dict] = []  # накопитель строк отчёта
-
-        # 1) Получаем план ΔV от оптимизатора (уже со знаком!)
-        dv_plan = self.optimizer.compute_dV(
-            self.geom, self.levels, self.series, self.modes
+        # 1) План ΔV и все производные величины — от оптимизатора
+        #    (уже со знаком!); симулятору остаётся оформить таблицу
+        plan = self.optimizer.compute_plan(
+            self.geom, self.levels, series, modes, self.interp
         )
-
-        # 2) Пошаговая симуляция
-        for i, month in enumerate(self.series.months):
-            mode = self.modes[i]
-            dV = dv_plan[i]  # <0 – сработка, >0 – наполнение
-
-            # ----- исходные данные за месяц -----
-            q_byt = self.series.domestic_inflows[i]  # приток (м³/с)
-            n_gar = self.series.guaranteed_capacity[i]  # гарант. мощность (МВт)
-
-            # ----- геометрия/уровни -----
-            start_vol = state.volume  # объём на начало месяца
-            end_vol = start_vol + dV  # объём на конец месяца
-            # пересчитываем отметки верхнего бьефа
-            start_head = compute_headwater_mark(start_vol, self.geom, self.interp)
-            end_head = compute_headwater_mark(end_vol, self.geom, self.interp)
-            avg_head = 0.5 * (start_head + end_head)
-
-            # ----- перерасход/дополнительный расход из/в водохранилище -----
-            res_delta_q = (-dV * 1e9) / SECONDS_PER_MONTH  # м³/с
-            plant_q = q_byt + res_delta_q  # итоговый расход через турбины
-
-            # ----- отметка нижнего бьефа и напор -----
-            z_low = compute_lowwater_mark(plant_q, self.geom, self.interp)
-            pressure = avg_head - z_low  # нетто‑напор
-
-            # ----- мощности -----
-            n_byt = compute_domestic_capacity(q_byt, pressure)
-            n_ges = min(
-                compute_domestic_capacity(plant_q, pressure),
-                self.levels.installed_capacity,
-            )
-
-            logger.debug(
-                "month=%2d mode=%s dV=%.3f Vend=%.3f N=%.1f",
-                month,
-                mode.name,
-                dV,
-                end_vol,
-                n_ges,
-            )
-
-            # ----- запись строки отчёта -----
-            records.append(
-                {
-                    "Месяц": month,
-                    "Режим": str(mode),
-                    "Q_быт, м³/с": q_byt,
-                    "Q_вдх, м³/с": res_delta_q,
-                    "Q_ГЭС, м³/с": plant_q,
-                    "dV, км³": dV,
-                    "V_вдх_нач, км³": start_vol,
-                    "V_вдх_кон, км³": end_vol,
-                    "Z_вб_нач, м": start_head,
-                    "Z_вб_кон, м": end_head,
-                    "Z_нб, м": z_low,
-                    "H, м": pressure,
-                    "N_быт, МВт": n_byt,
-                    "N_гар, МВт": n_gar,
-                    "N_ГЭС, МВт": n_ges,
-                }
-            )
-
-            # Переходим к следующему месяцу
-            state.volume = end_vol
+        dV, end_vol, n_ges = plan.dV, plan.end_vol, plan.n_ges
+
+        # Помесячный отладочный вывод — только если DEBUG действительно
+        # включён (иначе не тратим время даже на сбор аргументов)
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, month in enumerate(series.months):
+                logger.debug(
+                    "month=%2d mode=%s dV=%.3f Vend=%.3f N=%.1f",
+                    month,
+                    modes[i].name,
+                    dV[i],
+                    end_vol[i],
+                    n_ges[i],
+                )
+
+        # 2) Таблица отчёта по столбцам (порядок = _REPORT_COLUMNS)
+        modes_strs = np.array([str(mode) for mode in modes], dtype=object)
+        # Исходные ряды (месяцы, Q_быт, N_гар) передаём как есть, чтобы
+        # сохранить их тип в таблице
+        columns = (
+            series.months,
+            modes_strs,
+            series.domestic_inflows,
+            plan.res_delta_q,
+            plan.plant_q,
+            dV,
+            plan.start_vol,
+            end_vol,
+            plan.start_head,
+            plan.end_head,
+            plan.z_low,
+            plan.pressure,
+            plan.n_byt,
+            series.guaranteed_capacity,
+            n_ges,
+        )
+        report = dict(zip(_REPORT_COLUMNS, columns))
 
         # 3) Сводим результаты в DataFrame
-        pd.set_option("display.max_columns", None)
-        pd.set_option("display.width", 0)
-        return pd.DataFrame.from_records(records)
+        return pd.DataFrame(report)
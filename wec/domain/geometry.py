@@ -22,22 +22,147 @@
   расхода**.
 
 Это упрощает интерполяцию с помощью ``numpy.interp`` / ``scipy``.
+
+При создании объекта кривые приводятся к кортежам ``float`` и
+проверяются на монотонность (``ValueError`` при нарушении).  Объект
+заморожен (``frozen=True``): присвоить кривую после создания нельзя
+(``dataclasses.FrozenInstanceError``), поэтому производные данные не
+расходятся с кривыми.  Наклоны линейных участков
+рассчитываются один раз в ``__post_init__`` и затем используются
+методами ``interp_headwater`` / ``interp_lowwater`` / ``volume_at``
+(обратный переход Z → V; его результаты кэшируются в объекте — по
+нему много раз пересчитываются одни и те же НПУ и УМО).  Там же кривые
+один раз копируются в непрерывные массивы ``float64`` (``_hw``, ``_av``,
+``_lwm``, ``_lwi``) для векторной интерполяции ``numpy.interp`` без
+повторного преобразования списков при каждом вызове.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+def _segment_slopes(xs: Sequence[float], ys: Sequence[float]) -> Tuple[float, ...]:
+    """Наклоны (dy/dx) всех линейных участков кусочно‑линейной кривой.
+
+    Участок нулевой длины (повторяющийся узел) получает наклон 0: при
+    поиске участка ``bisect_right`` его всё равно пропускает.
+    """
+    return tuple(
+        (ys[i] - ys[i - 1]) / (xs[i] - xs[i - 1]) if xs[i] != xs[i - 1] else 0.0
+        for i in range(1, len(xs))
+    )
+
+
+def _check_curve(name: str, xs: Sequence[float], ys: Sequence[float]) -> None:
+    """Проверить, что кривая задана корректно и монотонно возрастает.
+
+    Узлы ``xs`` должны строго возрастать (иначе участок вырождается),
+    значения ``ys`` — не убывать (уровень не падает с ростом объёма или
+    расхода).
+    """
+    if len(xs) != len(ys) or len(xs) < 2:
+        raise ValueError(
+            f"{name} curve needs at least two points and equal-length arrays."
+        )
+    if any(x1 <= x0 for x0, x1 in zip(xs, xs[1:])):
+        raise ValueError(f"{name} curve nodes must be strictly increasing.")
+    if any(y1 < y0 for y0, y1 in zip(ys, ys[1:])):
+        raise ValueError(f"{name} curve marks must be non-decreasing.")
+
+
+def _lerp(x: float, xs: Sequence[float], ys: Sequence[float], slopes: Sequence[float]) -> float:  # noqa: E501
+    """Значение кривой в точке *x* по заранее посчитанным наклонам.
+
+    Края обрабатываются как в ``numpy.interp`` (крайнее значение вне
+    диапазона), порядок операций совпадает с ним бит‑в‑бит.
+    """
+    if x <= xs[0]:
+        return float(ys[0])
+    if x >= xs[-1]:
+        return float(ys[-1])
+    i = bisect_right(xs, x, 1, len(xs) - 1) - 1
+    return float(slopes[i] * (x - xs[i]) + ys[i])
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class Geometry:
     """Контейнер геометрических (гидравлических) кривых гидроузла."""
 
     # --- Верхний бьеф (водохранилище) ---
-    headwater_marks: List[float]      # отметка Zᵥб, м БС
-    average_volumes: List[float]      # объём Vср, км³
+    headwater_marks: Sequence[float]  # отметка Zᵥб, м БС
+    average_volumes: Sequence[float]  # объём Vср, км³
 
     # --- Нижний бьеф (русло) ---
-    lowwater_marks: List[float]       # отметка Zₙб, м БС
-    lowwater_inflows: List[float]     # расход Qₙб, м³/с
+    lowwater_marks: Sequence[float]   # отметка Zₙб, м БС
+    lowwater_inflows: Sequence[float] # расход Qₙб, м³/с
+
+    # --- Предрассчитанные наклоны участков (служебные поля) ---
+    _vz_slopes: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _qz_slopes: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _zv_slopes: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    # Кэш обратной кривой Z → V (отметка → объём)
+    _volume_cache: dict = field(init=False, repr=False, compare=False)
+
+    # --- Кривые в виде ndarray float64 (служебные поля) ---
+    _hw: np.ndarray = field(init=False, repr=False, compare=False)   # Zᵥб
+    _av: np.ndarray = field(init=False, repr=False, compare=False)   # Vср
+    _lwm: np.ndarray = field(init=False, repr=False, compare=False)  # Zₙб
+    _lwi: np.ndarray = field(init=False, repr=False, compare=False)  # Qₙб
+
+    def __post_init__(self) -> None:
+        # Объект заморожен (frozen=True): служебные поля и нормализованные
+        # кривые записываем в обход запрета через object.__setattr__.
+        # Кривые храним неизменяемыми кортежами float — их нельзя изменить
+        # после расчёта наклонов и кэшей
+        _set = object.__setattr__
+        _set(self, "headwater_marks", tuple(float(z) for z in self.headwater_marks))
+        _set(self, "average_volumes", tuple(float(v) for v in self.average_volumes))
+        _set(self, "lowwater_marks", tuple(float(z) for z in self.lowwater_marks))
+        _set(self, "lowwater_inflows", tuple(float(q) for q in self.lowwater_inflows))
+
+        # Санитарная проверка: бинарный поиск и кусочно‑линейные модели
+        # корректны только на монотонных кривых
+        _check_curve("V–Z", self.average_volumes, self.headwater_marks)
+        _check_curve("Q–Z", self.lowwater_inflows, self.lowwater_marks)
+
+        _set(self, "_vz_slopes", _segment_slopes(self.average_volumes, self.headwater_marks))
+        _set(self, "_qz_slopes", _segment_slopes(self.lowwater_inflows, self.lowwater_marks))
+        _set(self, "_zv_slopes", _segment_slopes(self.headwater_marks, self.average_volumes))
+        _set(self, "_volume_cache", {})
+
+        # Таблицы для векторных вызовов: конвертируем один раз, а не при
+        # каждом обращении к ``numpy.interp``
+        _set(self, "_hw", np.ascontiguousarray(self.headwater_marks, dtype=np.float64))
+        _set(self, "_av", np.ascontiguousarray(self.average_volumes, dtype=np.float64))
+        _set(self, "_lwm", np.ascontiguousarray(self.lowwater_marks, dtype=np.float64))
+        _set(self, "_lwi", np.ascontiguousarray(self.lowwater_inflows, dtype=np.float64))
+
+    # ------------------------------------------------------------------
+    # Быстрая интерполяция по собственным кривым (скаляр)
+    # ------------------------------------------------------------------
+
+    def interp_headwater(self, volume: float) -> float:
+        """Отметка верхнего бьефа Zᵥб (м) по объёму *volume* (км³)."""
+        return _lerp(volume, self.average_volumes, self.headwater_marks, self._vz_slopes)
+
+    def interp_lowwater(self, q: float) -> float:
+        """Отметка нижнего бьефа Zₙб (м) по расходу *q* (м³/с)."""
+        return _lerp(q, self.lowwater_inflows, self.lowwater_marks, self._qz_slopes)
+
+    def volume_at(self, mark: float) -> float:
+        """Объём водохранилища V (км³) при отметке верхнего бьефа *mark* (м).
+
+        Совпадает с ``numpy.interp(mark, headwater_marks, average_volumes)``;
+        результат запоминается для каждой отметки.
+        """
+        volume = self._volume_cache.get(mark)
+        if volume is None:
+            volume = self._volume_cache[mark] = _lerp(
+                mark, self.headwater_marks, self.average_volumes, self._zv_slopes
+            )
+        return volume
@@ -9,25 +9,41 @@
   ГЭС обязана выдавать в соответствующий месяц.
 
 Класс выступает простым контейнером с минимальной проверкой длины
-списков в ``__post_init__``.
+рядов в ``__post_init__``.  Там же ряды один раз приводятся к
+непрерывным массивам NumPy (``int64`` для месяцев, ``float64`` для
+расходов и мощностей): расчётные модули и ядра Numba работают с ними
+векторно и без повторных копий.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import Sequence
 
+import numpy as np
 
-@dataclass(slots=True)
+
+@dataclass(slots=True, eq=False)
 class HydrologicalSeries:
     """Контейнер ежемесячных гидрологических данных."""
 
-    months: List[int]                # календарные месяцы 1–12
-    domestic_inflows: List[float]    # Q_быт (м³/с)
-    guaranteed_capacity: List[float] # N_гар (МВт)
+    months: Sequence[int]                # календарные месяцы 1–12
+    domestic_inflows: Sequence[float]    # Q_быт (м³/с)
+    guaranteed_capacity: Sequence[float] # N_гар (МВт)
 
-    # Лёгкая санитарная проверка на согласованность длин
     def __post_init__(self) -> None:
+        # Ряды храним непрерывными массивами фиксированного типа (без копии,
+        # если на вход уже пришёл такой массив; срез‑«вид» с шагом, например
+        # столбец DataFrame, копируется — ядрам Numba нужен плотный буфер)
+        self.months = np.ascontiguousarray(self.months, dtype=np.int64)
+        self.domestic_inflows = np.ascontiguousarray(
+            self.domestic_inflows, dtype=np.float64
+        )
+        self.guaranteed_capacity = np.ascontiguousarray(
+            self.guaranteed_capacity, dtype=np.float64
+        )
+
+        # Лёгкая санитарная проверка на согласованность длин
         if not (
             len(self.months)
             == len(self.domestic_inflows)
@@ -36,3 +52,15 @@ class HydrologicalSeries:
             raise ValueError(
                 "All hydrological time‑series must have equal length."
             )
+
+    def __eq__(self, other: object) -> bool:
+        # Поля — массивы NumPy: сгенерированный dataclass ``__eq__`` сравнивал
+        # бы их поэлементно и падал на ``bool(array)``, поэтому сравниваем
+        # ряды целиком
+        if not isinstance(other, HydrologicalSeries):
+            return NotImplemented
+        return (
+            np.array_equal(self.months, other.months)
+            and np.array_equal(self.domestic_inflows, other.domestic_inflows)
+            and np.array_equal(self.guaranteed_capacity, other.guaranteed_capacity)
+        )
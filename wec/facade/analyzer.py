@@ -38,8 +38,56 @@ class WECAnalyzer:
         levels: StaticLevels,
         series: HydrologicalSeries,
     ) -> None:
-        self.g = geom
-        self.lvl = levels
+        # Селектор режимов кэширует классификацию и поворот года, поэтому
+        # живёт между вызовами simulate(); его сбрасывает присваивание
+        # любого из входов (``g``, ``lvl``, ``s``)
+        self._selector: MonthSelector | None = None
+        self._g = geom
+        self._lvl = levels
+        self._s = series
+
+    # ------------------------------------------------------------------
+    # Входные данные: присваивание сбрасывает кэш селектора
+    # ------------------------------------------------------------------
+
+    @property
+    def g(self) -> Geometry:
+        """Геометрия гидроузла."""
+        return self._g
+
+    @g.setter
+    def g(self, geom: Geometry) -> None:
+        self._g = geom
+        self._selector = None
+
+    @property
+    def lvl(self) -> StaticLevels:
+        """Статические уровни (НПУ, УМО, установленная мощность)."""
+        return self._lvl
+
+    @lvl.setter
+    def lvl(self, levels: StaticLevels) -> None:
+        self._lvl = levels
+        self._selector = None
+
+    @property
+    def s(self) -> HydrologicalSeries:
+        """Гидрологический ряд."""
+        return self._s
+
+    @s.setter
+    def s(self, series: HydrologicalSeries) -> None:
+        self._s = series
+        self._selector = None
+
+    def reset(self, series: HydrologicalSeries) -> None:
+        """Заменить гидрологический ряд, сохранив геометрию и уровни.
+
+        Сбрасываются только производные от ряда данные (режимы месяцев,
+        повёрнутый ряд); объекты :class:`Geometry` и :class:`StaticLevels`
+        вместе с их предрассчитанными таблицами переиспользуются.  Удобно
+        при переборе вариантов N_гар на одном гидроузле.
+        """
         self.s = series
 
     # ------------------------------------------------------------------
@@ -51,9 +99,10 @@ class WECAnalyzer:
         optimizer: str | AbstractOptimizer = "greedy",
     ) -> pd.DataFrame:
         """Запустить оптимизацию + симуляцию и вернуть таблицу результатов."""
-        # 1. Формируем режимы/поворачиваем год
-        sel = MonthSelector(self.s, self.g, self.lvl)
-        rot_s, modes = sel.rotated()
+        # 1. Формируем режимы/поворачиваем год (результат кэшируется)
+        if self._selector is None:
+            self._selector = MonthSelector(self.s, self.g, self.lvl)
+        rot_s, modes = self._selector.rotated()
 
         # 2. Запускаем симулятор с выбранным оптимизатором
         sim = ReservoirSimulator(
@@ -65,14 +114,18 @@ class WECAnalyzer:
     # Быстрые обёртки для графиков
     # ------------------------------------------------------------------
 
-    def plot_domestic_inflow(self):
+    def plot_domestic_inflow(self, ax=None):
         """График помесячных бытовых притоков."""
-        plots.plot_domestic_inflow(self.s)
+        return plots.plot_domestic_inflow(self.s, ax)
 
-    def plot_guaranteed_capacity(self):
+    def plot_guaranteed_capacity(self, ax=None):
         """График гарантированной мощности."""
-        plots.plot_guaranteed_capacity(self.s)
+        return plots.plot_guaranteed_capacity(self.s, ax)
 
-    def plot_reservoir_levels(self, df: pd.DataFrame):
+    def plot_reservoir_levels(self, df: pd.DataFrame, ax=None):
         """График уровней водохранилища по результатам симуляции."""
-        plots.plot_reservoir_levels(df, self.lvl)
+        return plots.plot_reservoir_levels(df, self.lvl, ax)
+
+    def plot_all(self, df: pd.DataFrame):
+        """Все три графика одной фигурой (возвращает Figure, без показа)."""
+        return plots.plot_all(self.s, df, self.lvl)
@@ -7,17 +7,23 @@
    сработки/наполнения.
 2. Функцию‑фабрику **get(name)**, возвращающую экземпляр оптимизатора
    по строковому алиасу ("greedy", "dynamic", ...). Это упрощает создание
-   оптимизаторов из конфигов или CLI‑аргументов.
+   оптимизаторов из конфигов или CLI‑аргументов.  Алиасы хранятся в
+   реестре, который пополняет декоратор **register(name)**.
+3. **Plan** — годовой план ΔV вместе с рассчитанными по нему расходами,
+   уровнями, напорами и мощностями (см. :mod:`.plan`).
 """
 
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List
+from importlib import import_module
+from typing import Callable, Dict, List, Type
 
 from ..domain.geometry import Geometry
 from ..domain.static_levels import StaticLevels
 from ..domain.hydrological_series import HydrologicalSeries
+from ..core.interpolation import Interpolator, default_interp
+from .plan import Plan, evaluate_plan
 
 # ---------------------------------------------------------------------------
 # Абстрактный базовый класс оптимизаторов
@@ -43,11 +49,65 @@ class AbstractOptimizer(ABC):
         """Вернуть годовой план ΔV (длина == len(series) == 12)."""
         ...
 
+    def compute_plan(
+        self,
+        geom: Geometry,
+        levels: StaticLevels,
+        series: HydrologicalSeries,
+        modes: List,
+        interp: Interpolator = default_interp,
+    ) -> Plan:
+        """Вернуть план ΔV вместе со всеми производными величинами.
+
+        Реализация по умолчанию — адаптер для оптимизаторов, которые
+        умеют только ``compute_dV``: план ΔV оценивается функцией
+        :func:`evaluate_plan`.  Оптимизатор, который и так считает эти
+        массивы по ходу поиска, может переопределить метод и вернуть их
+        без повторного расчёта.
+        """
+        dv_plan = self.compute_dV(geom, levels, series, modes)
+        return evaluate_plan(dv_plan, geom, levels, series, interp)
+
 
 # ---------------------------------------------------------------------------
-# Фабрика оптимизаторов по строковому имени
+# Реестр и фабрика оптимизаторов по строковому имени
 # ---------------------------------------------------------------------------
 
+# алиас → класс; заполняется декоратором :func:`register` при импорте модуля
+_REGISTRY: Dict[str, Type[AbstractOptimizer]] = {}
+
+# Встроенные оптимизаторы: модуль импортируется лениво, при первом
+# обращении к алиасу (так пакет не тянет всё сразу и нет циклов импорта)
+_BUILTIN_MODULES = {
+    "greedy": ".greedy",
+    "dynamic": ".dynamic",
+}
+
+
+def register(name: str) -> Callable[[Type[AbstractOptimizer]], Type[AbstractOptimizer]]:
+    """Декоратор класса: зарегистрировать оптимизатор под алиасом *name*.
+
+    Повторная регистрация того же класса (например, при перезагрузке
+    модуля) допустима; занять алиас другим классом нельзя — иначе
+    ``get(name)`` молча вернул бы не тот оптимизатор.
+
+    Raises
+    ------
+    ValueError
+        Если алиас *name* уже занят другим классом.
+    """
+
+    def deco(cls: Type[AbstractOptimizer]) -> Type[AbstractOptimizer]:
+        old = _REGISTRY.get(name)
+        if old is not None and (old.__module__, old.__qualname__) != (
+            cls.__module__, cls.__qualname__
+        ):
+            raise ValueError(f"Optimizer '{name}' is already registered")
+        _REGISTRY[name] = cls
+        return cls
+
+    return deco
+
 
 def get(name: str = "greedy") -> AbstractOptimizer:
     """Вернуть готовый объект‑оптимизатор по алиасу *name*.
@@ -57,20 +117,19 @@ def get(name: str = "greedy") -> AbstractOptimizer:
     name : str
         Допустимые значения по умолчанию:
         * ``"greedy"``  – GreedyOptimizer,
-        * ``"dynamic"`` – DynamicOptimizer.
+        * ``"dynamic"`` – DynamicOptimizer,
+        а также любые алиасы, зарегистрированные через :func:`register`.
 
     Raises
     ------
     ValueError
         Если передано неизвестное имя оптимизатора.
     """
-    if name == "greedy":
-        from .greedy import GreedyOptimizer
-
-        return GreedyOptimizer()
-    if name == "dynamic":
-        from .dynamic import DynamicOptimizer
-
-        return DynamicOptimizer()
-
-    raise ValueError(f"Unknown optimizer '{name}'")
+    cls = _REGISTRY.get(name)
+    if cls is None and name in _BUILTIN_MODULES:
+        # первый запрос встроенного алиаса: импорт модуля регистрирует класс
+        import_module(_BUILTIN_MODULES[name], __name__)
+        cls = _REGISTRY.get(name)
+    if cls is None:
+        raise ValueError(f"Unknown optimizer '{name}'")
+    return cls()
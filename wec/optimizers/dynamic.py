@@ -9,7 +9,8 @@
    - УМО (уровень мёртвого объёма)  → минимальный допустимый объём;
    - НПУ (нормальный подпорный уровень) → максимальный объём.
 
-   Между этими границами строится равномерная дискретная сетка (шаг `step`, км³).
+   Между этими границами строится равномерная дискретная сетка (шаг ≈ `step`, км³;
+   концы сетки точно совпадают с объёмами УМО и НПУ).
    Это делает задачу конечной и позволяет применить ДП.
 
 2. **Управление** ΔV_t = V_{t+1} – V_t  (км³):
@@ -22,6 +23,9 @@
    2) Среди решений с одинаковым D минимизируем отрицательную энергию (т.е. максимизируем выработку):
         E = Σ N_ГЭС(t) * τ,  τ – длительность месяца в часах.
       В коде используется «−E», чтобы и первый, и второй критерии можно было минимизировать.
+   Оба критерия свёрнуты в одну скалярную стоимость ``D · BIG − E`` с весом
+   ``BIG = 1e12``: он заведомо больше любой годовой выработки (МВт·ч), поэтому
+   сравнение по сумме совпадает с лексикографическим, а ДП хранит одну таблицу.
 
 4. **Ограничения**:
    - Мощность агрегатов ограничена установленной мощностью N_inst.
@@ -41,22 +45,31 @@
 
 from __future__ import annotations
 
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Sequence
 import numpy as np
 
-from . import AbstractOptimizer
+from . import AbstractOptimizer, register
 from ..core.formulas import (
     compute_headwater_mark,   # Z_вб(V): уровень верхнего бьефа по объёму
     compute_lowwater_mark,    # Z_нб(Q): уровень нижнего бьефа по расходу
     compute_domestic_capacity # N(Q, H): «бытовая» формула мощности
 )
+from ..core._kernels import HAS_NUMBA, dp_tables
 from ..constants import SECONDS_PER_MONTH
 from ..domain.geometry import Geometry
 from ..domain.static_levels import StaticLevels
 from ..domain.hydrological_series import HydrologicalSeries
 from ..core.month_selector import OperationMode
 
+# Вес дефицита в скалярной стоимости D·BIG − E (см. п. 3 описания модуля)
+_DEFICIT_WEIGHT = 1e12
+# Предельный размер блока переходов (элементов) на пути NumPy: ограничивает
+# память прямого хода независимо от числа узлов сетки
+_DP_BLOCK = 1 << 18
 
+
+@register("dynamic")
 class DynamicOptimizer(AbstractOptimizer):
     """ДП‑оптимизатор ΔV с лексикографической целью (минимум дефицита → максимум энергии)."""
 
@@ -79,94 +92,211 @@ class DynamicOptimizer(AbstractOptimizer):
         modes: List[OperationMode],
     ) -> List[float]:
         """Возвращает оптимальный план ΔV на 12 месяцев (км³/месяц)."""
+        return self.compute_dV_batch(geom, levels, [series], [modes])[0]
+
+    def compute_dV_batch(
+        self,
+        geom: Geometry,
+        levels: StaticLevels,
+        series_batch: Sequence[HydrologicalSeries],
+        modes_batch: Sequence[List[OperationMode]],
+        max_workers: int | None = None,
+    ) -> List[List[float]]:
+        """Планы ΔV для набора сценариев (ансамбль рядов) на одном гидроузле.
 
-        n_months = len(series.months)
+        Сетка состояний, отметки в её узлах и маска узлов выше УМО зависят
+        только от геометрии и уровней, поэтому строятся один раз на весь
+        набор; для каждого сценария выполняется лишь прямой и обратный ход.
+
+        Параметры
+        ----------
+        geom, levels
+            Геометрия и статические уровни (общие для всех сценариев).
+        series_batch : Sequence[HydrologicalSeries]
+            Гидрологические ряды сценариев.
+        modes_batch : Sequence[List[OperationMode]]
+            Режимы месяцев для каждого ряда (в том же порядке).
+        max_workers : int, optional
+            Число потоков для параллельного расчёта сценариев на пути
+            NumPy (по умолчанию — последовательно).  При установленной
+            Numba игнорируется: её ядро и так распараллелено.
+
+        Возвращает
+        ----------
+        List[List[float]]
+            Планы ΔV (км³/месяц) в порядке сценариев.
+        """
+        if len(series_batch) != len(modes_batch):
+            raise ValueError("Lengths of series_batch and modes_batch must match.")
 
         # ---- 1. Преобразуем уровни в объёмы (используем среднюю кривую V(Z)) ----
-        nrl_volume  = float(np.interp(levels.nrl,  geom.headwater_marks, geom.average_volumes))
-        dead_volume = float(np.interp(levels.dead, geom.headwater_marks, geom.average_volumes))
+        nrl_volume  = geom.volume_at(levels.nrl)
+        dead_volume = geom.volume_at(levels.dead)
 
         # ---- 2. Строим дискретную сетку состояний по объёму ----
-        step = self.step
-        grid = np.arange(dead_volume, nrl_volume + step, step)
-        # Страхуемся от накопления ошибок округления:
-        grid[0]  = dead_volume
-        grid[-1] = min(grid[-1], nrl_volume)
-        n_states = len(grid)
+        # linspace: точные концы сетки (УМО и НПУ) и детерминированное число
+        # узлов; шаг — ближайший к ``step``, делящий диапазон нацело
+        n_states = int(round((nrl_volume - dead_volume) / self.step)) + 1
+        grid = np.linspace(dead_volume, nrl_volume, n_states)
+
+        # Старт: в начале года водохранилище в НПУ — последний узел сетки
+        start_idx = n_states - 1
+
+        # Отметки верхнего бьефа в узлах сетки — один векторный вызов
+        z_grid = compute_headwater_mark(grid, geom)
+
+        # Параметры гидроузла, общие для всех сценариев, — в локальные имена
+        inst = float(levels.installed_capacity)
+        dead = float(levels.dead)
+
+        # Не опускаться ниже УМО (ни в начале, ни в конце месяца): узлы
+        # сетки ниже УМО исключаются из переходов целиком
+        above_dead = z_grid >= dead - 1e-9
+
+        def solve(series: HydrologicalSeries, modes: List[OperationMode]) -> List[float]:
+            # Ряды месяца — один раз в непрерывные float64‑массивы (в цикле по
+            # месяцам читаем элементы массива, а не атрибуты ``series``)
+            q_byt_arr = np.asarray(series.domestic_inflows, dtype=np.float64)
+            n_gar_arr = np.asarray(series.guaranteed_capacity, dtype=np.float64)
+
+            if HAS_NUMBA:
+                # --- быстрый путь: прямой ход ДП в параллельном ядре Numba ---
+                final_cost, prev = dp_tables(
+                    grid,
+                    z_grid,
+                    q_byt_arr,
+                    n_gar_arr,
+                    np.array([m is OperationMode.DISCHARGE for m in modes], dtype=np.int8),
+                    geom._lwi,
+                    geom._lwm,
+                    inst,
+                    dead,
+                    SECONDS_PER_MONTH,
+                    _DEFICIT_WEIGHT,
+                    start_idx,
+                )
+            else:
+                final_cost, prev = self._forward(
+                    geom, levels, q_byt_arr, n_gar_arr, modes,
+                    grid, z_grid, above_dead, start_idx,
+                )
+            return self._trace_back(grid, final_cost, prev, start_idx)
+
+        # Сценарии независимы.  Ядро Numba уже занимает все ядра (prange),
+        # поэтому потоки используются только на пути NumPy, где крупные
+        # векторные операции отпускают GIL
+        if HAS_NUMBA or max_workers is None or max_workers <= 1 or len(series_batch) < 2:
+            return [solve(s, m) for s, m in zip(series_batch, modes_batch)]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(solve, series_batch, modes_batch))
+
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def _forward(geom, levels, q_byt_arr, n_gar_arr, modes, grid, z_grid, above_dead, start_idx):
+        """Прямой ход ДП (путь NumPy): ``(стоимости в конце года, prev)``.
+
+        Переходы i → j месяца перебираются **блоками столбцов** j: для
+        блока строится прямоугольник «допустимые i × блок j» не больше
+        ``_DP_BLOCK`` элементов, и лучший предшественник каждого j
+        находится ``argmin`` по строкам.  Память — O(n + _DP_BLOCK)
+        вместо O(n²) при любом шаге сетки.
+        """
+        n_months = len(modes)
+        n_states = grid.shape[0]
 
         # ---- 3. Инициализация таблиц ДП ----
         INF = float("inf")
-        # def_cost[t, i] – минимальный суммарный дефицит к концу месяца t при объёме grid[i]
-        def_cost = np.full((n_months + 1, n_states), INF)
-        # en_cost[t, i]  – суммарная «отрицательная» энергия (−E) при том же условии
-        en_cost  = np.full((n_months + 1, n_states), INF)
-        # prev[t, i]     – индекс состояния в месяце t−1, из которого оптимально пришли в (t, i)
-        prev     = np.full((n_months,     n_states), -1, dtype=int)
-
-        # Старт: в начале года водохранилище в НПУ
-        start_idx = int(np.argmin(np.abs(grid - nrl_volume)))
-        def_cost[0, start_idx] = 0.0
-        en_cost[0,  start_idx] = 0.0
-
-        # ---- 4. Главный цикл Беллмана: перебор месяцев и переходов ----
+        # Стоимость нужна только для текущего месяца, поэтому храним одну
+        # строку (таблица целиком для обратного хода не нужна):
+        # cost[i]    – минимальная стоимость D·BIG − E к началу месяца при объёме grid[i]
+        cost = np.full(n_states, INF)
+        # prev[t, i] – индекс состояния в месяце t−1, из которого оптимально пришли в (t, i)
+        #              (int32 — вдвое компактнее int64; узлов сетки заведомо меньше 2³¹)
+        prev = np.full((n_months, n_states), -1, dtype=np.int32)
+
+        # Старт из НПУ: нулевые дефицит и энергия
+        cost[start_idx] = 0.0
+        cols_ok = np.flatnonzero(above_dead)  # допустимые конечные состояния
+        inst, sec = levels.installed_capacity, SECONDS_PER_MONTH  # локальные имена
+
+        # ---- 4. Главный цикл Беллмана ----
         for t in range(n_months):
-            q_byt = series.domestic_inflows[t]   # бытовая приточность (м³/с)
-            n_gar = series.guaranteed_capacity[t]# гарантированная мощность (МВт)
-            mode  = modes[t]                     # режим месяца (сработка/наполнение)
-
-            for i, v in enumerate(grid):
-                if def_cost[t, i] == INF:
-                    continue  # это состояние недостижимо
-
-                z_start = compute_headwater_mark(v, geom)
-
-                for j, vn in enumerate(grid):
-                    dV = vn - v  # управление
-                    # 4.1 Ограничение знака ΔV (режим)
-                    if (mode is OperationMode.DISCHARGE and dV > 0.0) or \
-                       (mode is OperationMode.FILL       and dV < 0.0):
-                        continue
-
-                    z_end = compute_headwater_mark(vn, geom)
-                    # 4.2 Не опускаться ниже УМО
-                    if z_start < levels.dead - 1e-9 or z_end < levels.dead - 1e-9:
-                        continue
-
-                    # 4.3 Гидравлика/энергия
-                    # Расход через ГЭС: приток + вклад водохранилища (ΔV/τ)
-                    q     = q_byt - dV * 1e9 / SECONDS_PER_MONTH
-                    z_low = compute_lowwater_mark(q, geom)
-                    head  = 0.5 * (z_start + z_end) - z_low
-
-                    n_ges   = min(compute_domestic_capacity(q, head), levels.installed_capacity)
-                    deficit = max(0.0, n_gar - n_ges)   # штрафуем только недобор
-                    energy  = n_ges * SECONDS_PER_MONTH / 3600.0  # МВт·ч за месяц
-
-                    # 4.4 Обновление стоимости (лексикографически)
-                    new_def = def_cost[t, i] + deficit
-                    new_en  = en_cost[t,  i] - energy  # «минус», чтобы тоже минимизировать
-
-                    # Принцип сравнения: сначала деф., затем энергия
-                    better = (
-                        new_def < def_cost[t + 1, j] or
-                        (np.isclose(new_def, def_cost[t + 1, j]) and new_en < en_cost[t + 1, j])
-                    )
-                    if better:
-                        def_cost[t + 1, j] = new_def
-                        en_cost[t + 1,  j] = new_en
-                        prev[t, j]         = i
-
-        # ---- 5. Восстановление оптимальной траектории ----
+            q_byt = q_byt_arr[t]  # бытовая приточность (м³/с)
+            n_gar = n_gar_arr[t]  # гарантированная мощность (МВт)
+            discharge = modes[t] is OperationMode.DISCHARGE
+            # Начальные состояния: выше УМО и достижимые (cost < INF) — из
+            # недостижимых не выходим, гидравлику для них не считаем
+            rows_all = np.flatnonzero(above_dead & np.isfinite(cost))
+            next_cost = np.full(n_states, INF)
+            if rows_all.size == 0:
+                cost = next_cost
+                continue
+            block = max(1, _DP_BLOCK // rows_all.size)
+
+            for b0 in range(0, cols_ok.size, block):
+                cols = cols_ok[b0:b0 + block]
+                # Сетка возрастает, поэтому знак ΔV = grid[j] − grid[i]
+                # задаётся порядком индексов: сработка (ΔV ≤ 0) → i ≥ j,
+                # наполнение (ΔV ≥ 0) → i ≤ j.  Строки, заведомо вне
+                # треугольника для всего блока, отбрасываем сразу.
+                if discharge:
+                    rows = rows_all[rows_all >= cols[0]]
+                else:
+                    rows = rows_all[rows_all <= cols[-1]]
+                if rows.size == 0:
+                    continue
+                r = rows[:, None]
+                c = cols[None, :]
+
+                # 4.1 Гидравлика/энергия для переходов блока (i, j)
+                dq    = (grid[c] - grid[r]) * 1e9 / sec   # вклад водохранилища в расход, м³/с
+                z_avg = 0.5 * (z_grid[r] + z_grid[c])     # средняя отметка ВБ за месяц
+                # Расход через ГЭС: приток + вклад водохранилища (ΔV/τ)
+                q     = q_byt - dq
+                z_low = compute_lowwater_mark(q.ravel(), geom).reshape(q.shape)
+                head  = z_avg - z_low
+
+                n_ges   = np.minimum(compute_domestic_capacity(q, head), inst)
+                deficit = np.maximum(0.0, n_gar - n_ges)   # штрафуем только недобор
+                energy  = n_ges * sec / 3600.0  # МВт·ч за месяц
+
+                # 4.2 Кандидаты стоимости; переходы против режима — INF
+                #     («минус E», чтобы минимизировать)
+                new_cost = cost[r] + (deficit * _DEFICIT_WEIGHT - energy)
+                wrong_sign = (r < c) if discharge else (r > c)
+                new_cost[wrong_sign] = INF
+
+                # 4.3 Лучший предшественник для каждого столбца j (при
+                #     равенстве — меньший индекс i: строки идут по возрастанию)
+                k = np.argmin(new_cost, axis=0)
+                best = new_cost[k, np.arange(cols.size)]
+                reach = np.isfinite(best)
+                next_cost[cols[reach]] = best[reach]
+                prev[t, cols[reach]] = rows[k[reach]]
+
+            cost = next_cost
+
+        return cost, prev
+
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def _trace_back(grid, final_cost, prev, start_idx) -> List[float]:
+        """Восстановить оптимальную траекторию и вернуть план ΔV.
+
+        *final_cost* — стоимости в конце года, *prev* — таблица переходов.
+        """
+        INF = float("inf")
+        n_months = prev.shape[0]
         end_idx = start_idx
-        if def_cost[n_months, end_idx] == INF:
+        if final_cost[end_idx] == INF:
             # теоретически не должно случиться, но на всякий случай берём лучший
-            end_idx = int(np.argmin(def_cost[n_months]))
+            end_idx = int(np.argmin(final_cost))
 
-        states = [end_idx]
+        # Индексы состояний на границах месяцев (обратный ход по prev)
+        states = np.empty(n_months + 1, dtype=np.intp)
+        states[-1] = end_idx
         for t in range(n_months - 1, -1, -1):
-            states.append(prev[t, states[-1]])
-        states.reverse()
+            states[t] = prev[t, states[t + 1]]
 
-        volumes = [grid[idx] for idx in states]
         # Возвращаем ΔV_t = V_{t+1} − V_t
-        return [volumes[t + 1] - volumes[t] for t in range(n_months)]
+        return np.diff(grid[states]).tolist()
@@ -4,9 +4,10 @@
 Алгоритм повторяет методику из классических пособий по гидроэнергетике:
 
 1. **Сработка (DISCHARGE):**
-   * Для каждого *discharge*-месяца пошагово увеличивается расход
-     водохранилища (ΔV>0 ⇒ Q_ГЭС↑), пока расчётная мощность
-     N_ГЭС не превысит 105% от гарантированной N_гар.
+   * Для каждого *discharge*-месяца подбирается (с шагом 0.01 км³)
+     наименьший расход водохранилища (ΔV>0 ⇒ Q_ГЭС↑), при котором
+     расчётная мощность N_ГЭС достигает 105% от гарантированной N_гар
+     (векторный перебор «лестницы» шагов).
    * Полученные объёмы срабатываемой воды сохраняются в списке
      ``disc_vol`` (положительные значения).
 
@@ -26,11 +27,12 @@
 
 from __future__ import annotations
 
+import heapq
 from typing import List
 
 import numpy as np
 
-from . import AbstractOptimizer
+from . import AbstractOptimizer, register
 from ..core.month_selector import OperationMode
 from ..core.formulas import (
     compute_headwater_mark,
@@ -39,7 +41,30 @@ from ..core.formulas import (
 )
 from ..constants import SECONDS_PER_MONTH
 
+# Шаг подбора объёма сработки, км³, и предельное число шагов (защита от
+# бесконечного поиска, если цель недостижима: 2²⁰ × 0.01 ≈ 10⁴ км³)
+_DV_STEP = 0.01
+_MAX_STEPS = 1 << 20
+# Начальное окно векторного перебора (шагов); при неудаче удваивается
+_SWEEP_STEPS = 128
 
+# «Лестница» значений ΔV: k‑й элемент равен сумме k шагов 0.01, сложенных
+# последовательно (ровно то число, которое давал цикл ``dV += 0.01``).
+# Растёт по мере надобности и переиспользуется между вызовами.
+_dv_ladder = np.zeros(1)
+
+
+def _ladder(k: int) -> np.ndarray:
+    """Вернуть «лестницу» ΔV длиной не меньше ``k + 1``."""
+    global _dv_ladder
+    if k >= len(_dv_ladder):
+        n = max(k + 1, 2 * len(_dv_ladder))
+        # cumsum складывает последовательно → те же округления, что и в цикле
+        _dv_ladder = np.cumsum(np.concatenate(([0.0], np.full(n - 1, _DV_STEP))))
+    return _dv_ladder
+
+
+@register("greedy")
 class GreedyOptimizer(AbstractOptimizer):
     """Жадный (Greedy) оптимизатор годовых ΔV."""
 
@@ -65,16 +90,12 @@ class GreedyOptimizer(AbstractOptimizer):
             disc_vol,
         )
 
-        # 3. Собираем итоговый «знаковый» список ΔV
-        dv: list[float] = []
-        di = fi = 0
-        for m in modes:
-            if m is OperationMode.DISCHARGE:
-                dv.append(-disc_vol[di])  # отрицательно: объём уменьшается
-                di += 1
-            else:
-                dv.append(+fill_vol[fi])  # положительно: объём растёт
-                fi += 1
+        # 3. Собираем итоговый «знаковый» список ΔV: оба списка сразу
+        #    раскладываются по своим индексам месяцев
+        plan = np.empty(len(modes))
+        plan[disc_idx] = np.negative(disc_vol)  # отрицательно: объём уменьшается
+        plan[fill_idx] = fill_vol               # положительно: объём растёт
+        dv: list[float] = plan.tolist()
 
         # Контроль замыкания годового цикла: сумма ΔV ≈ 0
         assert abs(sum(dv)) < 1e-6, "Greedy plan does not return to NPU"
@@ -85,24 +106,52 @@ class GreedyOptimizer(AbstractOptimizer):
     # ------------------------------------------------------------------
 
     def _calc_discharge(self, geom, levels, series, d_idx):
-        """Подбор объёма сработки для каждого DISCHARGE‑месяца."""
+        """Подбор объёма сработки для каждого DISCHARGE‑месяца.
+
+        Ищется наименьшее число шагов 0.01 км³, при котором N_ГЭС ≥ 105 %
+        N_гар.  Вместо перебора шагов по одному мощность считается
+        векторно сразу для всей «лестницы» ΔV, а первый успешный шаг
+        находится через ``np.argmax`` по маске.  Если в окне успеха нет,
+        окно удваивается.  Результат — ровно первое пересечение, как у
+        пошагового цикла (монотонность N_ГЭС(ΔV) не требуется).
+        """
+        # Всё, что не меняется по месяцам, — в локальные переменные
+        # (ряды — непрерывные float64‑массивы)
+        dom = np.asarray(series.domestic_inflows, dtype=np.float64)
+        gcap = np.asarray(series.guaranteed_capacity, dtype=np.float64)
+        nrl, inst_cap = levels.nrl, levels.installed_capacity
+        sec = SECONDS_PER_MONTH
+        # Вклад «лестницы» ΔV в расход не зависит от месяца — таблица на
+        # каждое окно считается один раз за вызов: размер окна → (ΔV, ΔQ)
+        tables: dict[int, tuple[np.ndarray, np.ndarray]] = {}
         vols = [0.0] * len(d_idx)
         for k, idx in enumerate(d_idx):
-            q_byt = series.domestic_inflows[idx]
-            n_gar = series.guaranteed_capacity[idx]
-            dV = 0.0  # начинаем с нулевой сработки
+            q_byt = dom[idx]
+            target = 1.05 * gcap[idx]
+
+            size = _SWEEP_STEPS
             while True:
+                table = tables.get(size)
+                if table is None:
+                    dVs = _ladder(size - 1)[:size]
+                    table = tables[size] = (dVs, dVs * 1e9 / sec)
+                dVs, dq = table
                 # учёт знака: ΔV (+) → отбор, но расход Q_ГЭС ↑
-                q_ges = q_byt + dV * 1e9 / SECONDS_PER_MONTH
+                q_ges = q_byt + dq
                 z_low = compute_lowwater_mark(q_ges, geom)
-                n_ges = min(
-                    compute_domestic_capacity(q_ges, levels.nrl - z_low),
-                    levels.installed_capacity,
+                n_ges = np.minimum(
+                    compute_domestic_capacity(q_ges, nrl - z_low),
+                    inst_cap,
                 )
-                if n_ges >= 1.05 * n_gar:
-                    break  # достигли цели 105 % N_гар
-                dV += 0.01  # шаг объёма, км³
-            vols[k] = dV
+                hit = n_ges >= target  # достигли цели 105 % N_гар
+                if hit.any():
+                    vols[k] = float(dVs[np.argmax(hit)])
+                    break
+                size *= 2
+                if size > _MAX_STEPS:
+                    raise ValueError(
+                        f"Cannot reach 105% of guaranteed capacity in month index {idx}."
+                    )
         return vols
 
     @staticmethod
@@ -111,44 +160,84 @@ class GreedyOptimizer(AbstractOptimizer):
         return [] if not fill_idx else [total_discharge / len(fill_idx)] * len(fill_idx)
 
     def _balance_fill(self, geom, levels, series, vols, f_idx, disc_vols):
-        """Балансировка fill‑месяцев: перенос 0.01 км³ от «богатых» к «бедным»."""
+        """Балансировка fill‑месяцев: перенос 0.01 км³ от «богатых» к «бедным».
+
+        Донор (месяц с максимальной мощностью) берётся из max‑кучи пар
+        ``(-мощность, индекс)``: O(log N) на перенос вместо полного
+        просмотра списка.  Записи кучи не удаляются при обновлении
+        мощности — устаревшие (не совпадающие с ``caps``) отбрасываются
+        при извлечении.  При равных мощностях первым идёт меньший индекс,
+        как у ``np.argmax``.
+        """
         if not f_idx:
             return []
         v = vols.copy()
+        # Отметки Zᵥб по объёму: в цикле переносов одни и те же объёмы
+        # встречаются многократно — интерполяцию запоминаем на весь вызов
+        heads: dict[float, float] = {}
         caps = self._recompute_caps(geom, levels, series, v, f_idx)
+        heap = [(-cap, j) for j, cap in enumerate(caps)]
+        heapq.heapify(heap)
+        # локальные ссылки для горячего цикла переносов
+        gcap = np.asarray(series.guaranteed_capacity, dtype=np.float64)
+        cap_single = self._cap_single
+        push, pop = heapq.heappush, heapq.heappop
         for i, idx in enumerate(f_idx):
-            n_gar = series.guaranteed_capacity[idx]
+            n_gar = gcap[idx]
             while caps[i] < 1.05 * n_gar and v[i] >= 0.01:
-                j = int(np.argmax(caps))  # месяц с максимальным запасом мощности
+                # месяц с максимальным запасом мощности (ленивое удаление
+                # устаревших записей с вершины кучи)
+                while -heap[0][0] != caps[heap[0][1]]:
+                    pop(heap)
+                j = heap[0][1]
                 v[j] += 0.01
                 v[i] -= 0.01
-                caps[i] = self._cap_single(geom, levels, series, v[i], idx)
-                caps[j] = self._cap_single(geom, levels, series, v[j], f_idx[j])
+                caps[i] = cap_single(geom, levels, series, v[i], idx, heads)
+                caps[j] = cap_single(geom, levels, series, v[j], f_idx[j], heads)
+                push(heap, (-caps[i], i))
+                push(heap, (-caps[j], j))
         return v
 
     # ------------------------------------------------------------------
     # Helper‑функции пересчёта мощностей
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _headwater(geom, vol, heads=None):
+        """Zᵥб по объёму *vol* с необязательным словарём‑кэшем *heads*."""
+        if heads is None:
+            return compute_headwater_mark(vol, geom)
+        head = heads.get(vol)
+        if head is None:
+            head = heads[vol] = compute_headwater_mark(vol, geom)
+        return head
+
     def _recompute_caps(self, geom, levels, series, vols, idx_list):
-        caps = []
-        vol = levels.nrl  # стартуем с НПУ
-        for dV, idx in zip(vols, idx_list):
-            q = series.domestic_inflows[idx] - dV * 1e9 / SECONDS_PER_MONTH
-            vol_end = vol + dV
-            avg_h = 0.5 * (
-                compute_headwater_mark(vol, geom)
-                + compute_headwater_mark(vol_end, geom)
-            )
-            z_low = compute_lowwater_mark(q, geom)
-            caps.append(compute_domestic_capacity(q, avg_h - z_low))
-            vol = vol_end  # переход к следующему месяцу
-        return caps
-
-    def _cap_single(self, geom, levels, series, dV, idx):
-        """Мощность ГЭС в **одном** fill‑месяце при заданном dV."""
+        """Мощности ГЭС во всех fill‑месяцах — одним векторным проходом.
+
+        Объёмы на границах месяцев получаются ``np.cumsum`` (складывает
+        последовательно, как и помесячный цикл), после чего отметки,
+        расходы и мощности считаются сразу для всех месяцев.
+        """
+        dv = np.asarray(vols, dtype=np.float64)
+        dom = np.asarray(series.domestic_inflows, dtype=np.float64)
+        q = dom[idx_list] - dv * 1e9 / SECONDS_PER_MONTH
+        # стартуем с НПУ; отметка конца месяца — она же начало следующего
+        marks = compute_headwater_mark(
+            np.cumsum(np.concatenate(([levels.nrl], dv))), geom
+        )
+        avg_h = 0.5 * (marks[:-1] + marks[1:])
+        z_low = compute_lowwater_mark(q, geom)
+        return compute_domestic_capacity(q, avg_h - z_low).tolist()
+
+    def _cap_single(self, geom, levels, series, dV, idx, heads=None):
+        """Мощность ГЭС в **одном** fill‑месяце при заданном dV.
+
+        ``heads`` — необязательный словарь «объём → Zᵥб» для повторного
+        использования уже рассчитанных отметок (ключ — точный объём).
+        """
         q = series.domestic_inflows[idx] - dV * 1e9 / SECONDS_PER_MONTH
-        avg_h = compute_headwater_mark(levels.nrl + dV, geom)
+        avg_h = self._headwater(geom, levels.nrl + dV, heads)
         return compute_domestic_capacity(
             q, avg_h - compute_lowwater_mark(q, geom)
         )
@@ -0,0 +1,134 @@
+# wec/optimizers/plan.py
+"""Годовой план ΔV вместе с его энергетической оценкой.
+
+Оптимизатор выдаёт ΔV (км³) по месяцам, а всё остальное — объёмы,
+отметки бьефов, расходы, напоры и мощности — однозначно следует из этих
+ΔV и «физики» гидроузла.  Модуль собирает эти величины в один объект
+:class:`Plan`, чтобы они рассчитывались **один раз** (в
+:meth:`AbstractOptimizer.compute_plan`), а симулятор лишь оформлял
+готовые массивы в таблицу.
+
+Функция :func:`evaluate_plan` — общий «адаптер»: она достраивает план по
+одному списку ΔV и потому подходит любому оптимизатору, который
+реализует только ``compute_dV``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from ..core.formulas import (
+    compute_headwater_mark,
+    compute_lowwater_mark,
+    compute_domestic_capacity,
+)
+from ..core.interpolation import Interpolator, default_interp
+from ..core._kernels import HAS_NUMBA, simulate_year
+from ..domain.geometry import Geometry
+from ..domain.static_levels import StaticLevels
+from ..domain.hydrological_series import HydrologicalSeries
+from ..constants import SECONDS_PER_MONTH
+
+
+@dataclass(slots=True)
+class Plan:
+    """Годовой план ΔV и все производные помесячные величины (ndarray)."""
+
+    dV: np.ndarray           # ΔV, км³ (<0 – сработка, >0 – наполнение)
+    start_vol: np.ndarray    # V_вдх в начале месяца, км³
+    end_vol: np.ndarray      # V_вдх в конце месяца, км³
+    start_head: np.ndarray   # Z_вб в начале месяца, м
+    end_head: np.ndarray     # Z_вб в конце месяца, м
+    res_delta_q: np.ndarray  # Q_вдх — расход из/в водохранилище, м³/с
+    plant_q: np.ndarray      # Q_ГЭС — расход через турбины, м³/с
+    z_low: np.ndarray        # Z_нб, м
+    pressure: np.ndarray     # нетто‑напор H, м
+    n_byt: np.ndarray        # бытовая мощность N_быт, МВт
+    n_ges: np.ndarray        # мощность ГЭС N_ГЭС (≤ N_inst), МВт
+
+
+def evaluate_plan(
+    dv_plan: Sequence[float],
+    geom: Geometry,
+    levels: StaticLevels,
+    series: HydrologicalSeries,
+    interp: Interpolator = default_interp,
+) -> Plan:
+    """Рассчитать все помесячные величины годового плана *dv_plan*.
+
+    Год начинается с водохранилища, заполненного до НПУ; далее
+    V_{t+1} = V_t + ΔV_t.
+
+    Параметры
+    ----------
+    dv_plan : Sequence[float]
+        ΔV по месяцам, км³ (уже со знаком).
+    geom, levels, series
+        Геометрия, статические уровни и гидрологический ряд.
+    interp : Interpolator, optional
+        Интерполятор кривых; по умолчанию ``default_interp``.
+
+    Возвращает
+    ----------
+    Plan
+        План с массивами объёмов, отметок, расходов, напоров и мощностей.
+    """
+    dV = np.asarray(dv_plan, dtype=np.float64)
+    q_byt = np.asarray(series.domestic_inflows, dtype=np.float64)
+    nrl_volume = geom.volume_at(levels.nrl)
+
+    if HAS_NUMBA and interp is default_interp:
+        # --- быстрый путь: весь год в скомпилированном ядре Numba ---
+        return Plan(
+            dV,
+            *simulate_year(
+                dV,
+                q_byt,
+                geom._hw,
+                geom._av,
+                geom._lwm,
+                geom._lwi,
+                nrl_volume,
+                float(levels.installed_capacity),
+                SECONDS_PER_MONTH,
+            ),
+        )
+
+    # ----- геометрия/уровни -----
+    # Объёмы на границах месяцев (cumsum складывает последовательно, как
+    # и помесячный цикл)
+    volumes = np.cumsum(np.concatenate(([nrl_volume], dV)))
+    # отметки верхнего бьефа на всех границах месяцев — один вызов
+    marks = compute_headwater_mark(volumes, geom, interp)
+    avg_head = 0.5 * (marks[:-1] + marks[1:])
+
+    # ----- перерасход/дополнительный расход из/в водохранилище -----
+    res_delta_q = (-dV * 1e9) / SECONDS_PER_MONTH  # м³/с
+    plant_q = q_byt + res_delta_q  # итоговый расход через турбины
+
+    # ----- отметка нижнего бьефа и напор -----
+    z_low = compute_lowwater_mark(plant_q, geom, interp)
+    pressure = avg_head - z_low  # нетто‑напор
+
+    # ----- мощности -----
+    n_byt = compute_domestic_capacity(q_byt, pressure)
+    n_ges = np.minimum(
+        compute_domestic_capacity(plant_q, pressure),
+        levels.installed_capacity,
+    )
+    return Plan(
+        dV,
+        volumes[:-1],
+        volumes[1:],
+        marks[:-1],
+        marks[1:],
+        res_delta_q,
+        plant_q,
+        z_low,
+        pressure,
+        n_byt,
+        n_ges,
+    )
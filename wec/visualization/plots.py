@@ -1,69 +1,125 @@
 # wec/visualization/plots.py
 """Мини‑обёртки над matplotlib для отображения ключевых графиков.
 
-Функции строят *интерактивные* графики (``plt.show()``) и не возвращают
-объекты Figure/Axes, чтобы оставить API как можно более простым.
-При желании можно доработать, чтобы принимать объект ``ax`` или
-возвращать фигуру для встраивания в отчёты.
+Каждая функция принимает необязательный аргумент ``ax`` и возвращает
+объект Axes, в котором построен график:
+
+* ``ax`` не задан — график строится в текущих осях pyplot и сразу
+  показывается (``plt.show()``), как в интерактивной работе;
+* ``ax`` задан — график рисуется в переданные оси **без** показа, что
+  позволяет собрать несколько графиков в одну фигуру и сохранить её
+  в отчёт (в том числе в «безоконном» режиме ``Agg``).
+
+:func:`plot_all` собирает все три графика в одну фигуру и возвращает её.
+
+``matplotlib.pyplot`` импортируется лениво — внутри функций: импорт
+модуля (а с ним и ``import wec``) не платит за загрузку matplotlib,
+если графики не строятся.
 """
 
 from __future__ import annotations
 
-import matplotlib.pyplot as plt
+from typing import TYPE_CHECKING
+
 import pandas as pd
 
 from ..domain.hydrological_series import HydrologicalSeries
 from ..domain.static_levels import StaticLevels
 
+if TYPE_CHECKING:  # только для аннотаций: matplotlib грузим лениво
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
 # ---------------------------------------------------------------------------
 # 1) График бытовых притоков
 # ---------------------------------------------------------------------------
 
-def plot_domestic_inflow(series: HydrologicalSeries) -> None:
+def plot_domestic_inflow(series: HydrologicalSeries, ax: Axes | None = None) -> Axes:
     """Гистограмма Q_быт по месяцам."""
-    plt.bar(series.months, series.domestic_inflows)
-    plt.title("Бытовая приточность по месяцам")
-    plt.xlabel("Месяц")
-    plt.ylabel("Q, м³/с")
-    plt.grid(True)
-    plt.show()
+    import matplotlib.pyplot as plt
+
+    show = ax is None
+    if show:
+        ax = plt.gca()
+    ax.bar(series.months, series.domestic_inflows)
+    ax.set_title("Бытовая приточность по месяцам")
+    ax.set_xlabel("Месяц")
+    ax.set_ylabel("Q, м³/с")
+    ax.grid(True)
+    if show:
+        plt.show()
+    return ax
 
 # ---------------------------------------------------------------------------
 # 2) График гарантированной мощности
 # ---------------------------------------------------------------------------
 
-def plot_guaranteed_capacity(series: HydrologicalSeries) -> None:
+def plot_guaranteed_capacity(series: HydrologicalSeries, ax: Axes | None = None) -> Axes:
     """Гистограмма N_гар по месяцам."""
-    plt.bar(series.months, series.guaranteed_capacity)
-    plt.title("Гарантированная мощность по месяцам")
-    plt.xlabel("Месяц")
-    plt.ylabel("N_гар, МВт")
-    plt.grid(True)
-    plt.show()
+    import matplotlib.pyplot as plt
+
+    show = ax is None
+    if show:
+        ax = plt.gca()
+    ax.bar(series.months, series.guaranteed_capacity)
+    ax.set_title("Гарантированная мощность по месяцам")
+    ax.set_xlabel("Месяц")
+    ax.set_ylabel("N_гар, МВт")
+    ax.grid(True)
+    if show:
+        plt.show()
+    return ax
 
 # ---------------------------------------------------------------------------
 # 3) График уровней водохранилища
 # ---------------------------------------------------------------------------
 
-def plot_reservoir_levels(df: pd.DataFrame, levels: StaticLevels) -> None:
+def plot_reservoir_levels(
+    df: pd.DataFrame, levels: StaticLevels, ax: Axes | None = None
+) -> Axes:
     """Линия уровня верхнего бьефа за год + отметки НПУ/УМО."""
+    import matplotlib.pyplot as plt
+
+    show = ax is None
+    if show:
+        ax = plt.gca()
     x = range(len(df) + 1)
     y = list(df["Z_вб_нач, м"]) + [df["Z_вб_кон, м"].iloc[-1]]
     months = list(df["Месяц"]) + [df["Месяц"].iloc[0]]
 
-    plt.plot(x, y, marker="o")
-    plt.xticks(x, months)
+    ax.plot(x, y, marker="o")
+    ax.set_xticks(x)
+    ax.set_xticklabels(months)
 
     # Добавляем горизонтальные линии НПУ и УМО
-    plt.axhline(levels.nrl, ls="--", color="red", label="НПУ")
-    plt.axhline(levels.dead, ls="--", color="green", label="УМО")
+    ax.axhline(levels.nrl, ls="--", color="red", label="НПУ")
+    ax.axhline(levels.dead, ls="--", color="green", label="УМО")
 
-    plt.title(
+    ax.set_title(
         "График сработки/наполнения водохранилища\n"
         "на годовом интервале (шаг = 1 месяц)"
     )
-    plt.xlabel("Месяц")
-    plt.ylabel("Z_вб, м")
-    plt.grid(True)
-    plt.legend()
-    plt.show()
+    ax.set_xlabel("Месяц")
+    ax.set_ylabel("Z_вб, м")
+    ax.grid(True)
+    ax.legend()
+    if show:
+        plt.show()
+    return ax
+
+# ---------------------------------------------------------------------------
+# 4) Все графики одной фигурой
+# ---------------------------------------------------------------------------
+
+def plot_all(
+    series: HydrologicalSeries, df: pd.DataFrame, levels: StaticLevels
+) -> Figure:
+    """Фигура из трёх графиков (притоки, N_гар, уровни) без показа."""
+    import matplotlib.pyplot as plt
+
+    fig, axes = plt.subplots(3, 1, figsize=(10, 12))
+    plot_domestic_inflow(series, axes[0])
+    plot_guaranteed_capacity(series, axes[1])
+    plot_reservoir_levels(df, levels, axes[2])
+    fig.tight_layout()
+    return fig